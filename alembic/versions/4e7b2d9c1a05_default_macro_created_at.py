@@ -0,0 +1,38 @@
+"""Default macro created_at to the current timestamp
+
+Revision ID: 4e7b2d9c1a05
+Revises: c3d8e1f4a9b2
+Create Date: 2026-10-14 14:03:27.911452
+
+"""
+from sqlalchemy import text
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+from src.database.utils.migrations import set_lock_wait_timeout
+
+# revision identifiers, used by Alembic.
+revision = '4e7b2d9c1a05'
+down_revision = 'c3d8e1f4a9b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    set_lock_wait_timeout()
+    op.alter_column(
+        table_name='macro', column_name='created_at',
+        existing_type=mysql.TIMESTAMP(),
+        server_default=text('CURRENT_TIMESTAMP'),
+        existing_nullable=False
+    )
+
+
+def downgrade() -> None:
+    set_lock_wait_timeout()
+    op.alter_column(
+        table_name='macro', column_name='created_at',
+        existing_type=mysql.TIMESTAMP(),
+        server_default=None,
+        existing_nullable=False
+    )
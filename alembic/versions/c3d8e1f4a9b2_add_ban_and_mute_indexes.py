@@ -0,0 +1,29 @@
+"""Add ban and mute indexes
+
+Revision ID: c3d8e1f4a9b2
+Revises: 9aa21aede2ec
+Create Date: 2026-10-14 10:12:41.503118
+
+"""
+from alembic import op
+from src.database.utils.migrations import create_index_online, set_lock_wait_timeout
+
+# revision identifiers, used by Alembic.
+revision = 'c3d8e1f4a9b2'
+down_revision = '9aa21aede2ec'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    set_lock_wait_timeout()
+    create_index_online('ix_ban_unbanned_unban_time', 'ban', ['unbanned', 'unban_time'])
+    create_index_online('ix_ban_user_id_unbanned', 'ban', ['user_id', 'unbanned'])
+    create_index_online('ix_mute_unmute_time', 'mute', ['unmute_time'])
+
+
+def downgrade() -> None:
+    set_lock_wait_timeout()
+    op.drop_index('ix_mute_unmute_time', table_name='mute')
+    op.drop_index('ix_ban_user_id_unbanned', table_name='ban')
+    op.drop_index('ix_ban_unbanned_unban_time', table_name='ban')
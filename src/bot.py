@@ -54,6 +54,7 @@ class Bot(DiscordBot):
         """
         super().__init__(**kwargs)
         self.role_manager = None
+        self._persistent_views_registered = False
         if not mock:
             logger.debug("HTTP session will be initialized in an asynchronous context")
             self.http_session = None
@@ -97,8 +98,13 @@ class Bot(DiscordBot):
         """Re-register persistent UI views so buttons survive bot restarts."""
         from src.views.bandecisionview import register_ban_views
 
+        # `on_ready` fires again on every reconnect, but the views only need to be added once per process.
+        if self._persistent_views_registered:
+            return
+
         try:
             await register_ban_views(self)
+            self._persistent_views_registered = True
         except Exception:
             logger.exception("Failed to register persistent ban decision views")
 
@@ -1,40 +1,136 @@
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 
+from discord import ClientException, Guild, HTTPException, Member, NotFound, Object, User
 from discord.ext import commands, tasks
 from sqlalchemy import select
+from sqlalchemy.exc import NoResultFound
 
 from src import settings
 from src.bot import Bot
 from src.database.models import Ban, Mute
 from src.database.session import AsyncSessionLocal
-from src.helpers.ban import unban_member, unmute_member
+from src.helpers.ban import lift_ban, lift_mute, unban_member, unmute_member
 from src.helpers.schedule import schedule
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of users Discord resolves per gateway member request.
+MEMBER_QUERY_LIMIT = 100
+# Maximum number of concurrent API lookups of guild bans.
+BAN_FETCH_CONCURRENCY = 20
+
+# How often the DB is polled for expiring bans and mutes, and how far ahead each poll looks. `schedule` sleeps until
+# the exact expiry, so the poll does not need to run every minute. Bans and mutes issued while the bot runs also get
+# their own timer when they are issued, so the poll may race that timer and find the row already lifted.
+POLL_INTERVAL = timedelta(minutes=5)
+
 
 class ScheduledTasks(commands.Cog):
     """Cog for handling scheduled tasks."""
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        # Users with a pending lift from this cog, so a later poll does not schedule them a second time.
+        self._scheduled_unbans: set[int] = set()
+        self._scheduled_unmutes: set[int] = set()
         self.all_tasks.start()
 
-    @tasks.loop(minutes=1)
+    @tasks.loop(seconds=POLL_INTERVAL.total_seconds())
     async def all_tasks(self) -> None:
         """Gathers all scheduled tasks."""
         logger.debug("Gathering scheduled tasks...")
-        await self.auto_unban()
-        await self.auto_unmute()
-        # await asyncio.gather(self.auto_unmute())
+        # Each task opens its own session, as a single connection cannot run both queries at once. Running them
+        # concurrently also keeps the unmutes from waiting on the unbans scheduled by `auto_unban`.
+        results = await asyncio.gather(self.auto_unban(), self.auto_unmute(), return_exceptions=True)
+        # A failing task must not escape, `tasks.Loop` stops for good on any error but connection issues.
+        for name, result in zip(("auto_unban", "auto_unmute"), results):
+            if isinstance(result, Exception):
+                logger.error(f"Scheduled task {name} failed.", exc_info=result)
         logger.debug("Scheduling completed.")
 
+    def _get_guilds(self) -> list[Guild]:
+        """Resolve the configured guilds once, skipping the ones the bot cannot see."""
+        guilds = []
+        for guild_id in settings.guild_ids:
+            guild = self.bot.get_guild(guild_id)
+            if not guild:
+                logger.warning(f"Unable to find guild with ID {guild_id}.")
+                continue
+            guilds.append(guild)
+        return guilds
+
+    async def _get_members(self, guild: Guild, user_ids: list[int]) -> dict[int, Member]:
+        """
+        Resolve which of the users are members of a guild.
+
+        Members are taken from the guild cache first and cache misses are queried over the gateway in chunks of
+        `MEMBER_QUERY_LIMIT`.
+        """
+        members: dict[int, Member] = {}
+        uncached = []
+        for user_id in user_ids:
+            if member := guild.get_member(user_id):
+                members[user_id] = member
+            else:
+                uncached.append(user_id)
+
+        chunks = [uncached[i:i + MEMBER_QUERY_LIMIT] for i in range(0, len(uncached), MEMBER_QUERY_LIMIT)]
+        try:
+            results = await asyncio.gather(
+                *(guild.query_members(user_ids=chunk, limit=MEMBER_QUERY_LIMIT, cache=True) for chunk in chunks)
+            )
+        except (asyncio.TimeoutError, ClientException) as exc:
+            logger.warning(f"Could not query members of guild {guild.id}.", exc_info=exc)
+            results = []
+        for chunk_members in results:
+            members.update((member.id, member) for member in chunk_members)
+        return members
+
+    async def _get_banned(self, guild: Guild, user_ids: list[int]) -> dict[int, User | Object]:
+        """Resolve which of the users are banned from a guild, at most `BAN_FETCH_CONCURRENCY` lookups at a time."""
+        semaphore = asyncio.Semaphore(BAN_FETCH_CONCURRENCY)
+
+        async def fetch(user_id: int) -> User | Object | None:
+            async with semaphore:
+                try:
+                    entry = await guild.fetch_ban(Object(id=user_id))
+                except NotFound:
+                    return None
+                except HTTPException as exc:
+                    # Still attempt the unban, as the ban row is lifted for all guilds at once.
+                    logger.warning(f"Could not fetch ban of user {user_id} in guild {guild.id}.", exc_info=exc)
+                    return Object(id=user_id)
+                return entry.user
+
+        users = await asyncio.gather(*(fetch(user_id) for user_id in user_ids))
+        return {user.id: user for user in users if user}
+
+    async def _unban(self, user_id: int, targets: list[tuple[Guild, User | Object]]) -> None:
+        """Unban a user from every guild they are banned from, then flag their ban as lifted once."""
+        try:
+            for guild, user in targets:
+                await unban_member(guild, user, lift=False)
+            await lift_ban(user_id)
+        except NoResultFound:
+            logger.info(f"Ban of user_id {user_id} was already lifted.")
+
+    async def _unmute(self, user_id: int, targets: list[tuple[Guild, Member]]) -> None:
+        """Unmute a user in every guild they are a member of, then remove their mute once."""
+        try:
+            for guild, member in targets:
+                await unmute_member(guild, member, lift=False)
+            await lift_mute(user_id)
+        except NoResultFound:
+            logger.info(f"Mute of user_id {user_id} was already lifted.")
+
     async def auto_unban(self) -> None:
         """Task to automatically unban members."""
         unban_tasks = []
-        unban_time = datetime.timestamp(datetime.now() + timedelta(minutes=1)) * 1000
+        # `unban_time` is stored in epoch seconds, only fetch the bans that expire before the next tick.
+        unban_time = int(time.time() + POLL_INTERVAL.total_seconds())
         logger.debug(f"Checking for bans to remove until {unban_time}.")
         async with AsyncSessionLocal() as session:
             result = await session.scalars(
@@ -43,61 +139,87 @@ class ScheduledTasks(commands.Cog):
             bans = result.all()
             logger.debug(f"Got {len(bans)} bans from DB.")
 
-        for guild_id in settings.guild_ids:
-            logger.debug(f"Running for guild: {guild_id}.")
-            guild = self.bot.get_guild(guild_id)
-            if not guild:
-                logger.warning(f"Unable to find guild with ID {guild_id}.")
-                continue
-
-            for ban in bans:
-                run_at = datetime.fromtimestamp(ban.unban_time)
-                logger.debug(
-                    f"Got user_id: {ban.user_id} and unban timestamp: {run_at} from DB."
-                )
-                member = await self.bot.get_member_or_user(guild, ban.user_id)
-                if not member:
-                    logger.info(f"Member with id: {ban.user_id} not found.")
-                    continue
-                unban_task = schedule(unban_member(guild, member), run_at=run_at)
+        # Key by user so a user with several open bans is only scheduled once. The query is unordered, so take the
+        # latest expiry explicitly rather than whichever row comes back first.
+        due: dict[int, int] = {}
+        for ban in bans:
+            logger.debug(f"Got user_id: {ban.user_id} and unban timestamp: {ban.unban_time} from DB.")
+            due[ban.user_id] = max(due.get(ban.user_id, 0), ban.unban_time)
+
+        guilds = self._get_guilds()
+        if not guilds:
+            return
+        run_times = {
+            user_id: datetime.fromtimestamp(expires_at)
+            for user_id, expires_at in due.items()
+            if user_id not in self._scheduled_unbans
+        }
+        self._scheduled_unbans.update(run_times)
+        try:
+            # The ban row is shared by all guilds, so each user gets one task that unbans them wherever they are
+            # banned and lifts the row once.
+            targets: dict[int, list[tuple[Guild, User | Object]]] = {user_id: [] for user_id in run_times}
+            for guild in guilds:
+                for user_id, user in (await self._get_banned(guild, list(run_times))).items():
+                    targets[user_id].append((guild, user))
+
+            for user_id, run_at in run_times.items():
+                if not targets[user_id]:
+                    logger.info(f"User with id: {user_id} is not banned from any guild.")
+                unban_task = schedule(self._unban(user_id, targets[user_id]), run_at=run_at)
                 unban_tasks.append(unban_task)
-                logger.info(f"Scheduled unban task for user_id {ban.user_id} at {run_at}.")
+                logger.info(f"Scheduled unban task for user_id {user_id} at {run_at}.")
 
-        await asyncio.gather(*unban_tasks)
+            results = await asyncio.gather(*unban_tasks, return_exceptions=True)
+        finally:
+            self._scheduled_unbans.difference_update(run_times)
+        for user_id, result in zip(run_times, results):
+            if isinstance(result, Exception):
+                logger.error(f"Unban task for user_id {user_id} failed.", exc_info=result)
 
     async def auto_unmute(self) -> None:
         """Task to automatically unmute members."""
         unmute_tasks = []
-        unmute_time = datetime.timestamp(datetime.now() + timedelta(minutes=1)) * 1000
+        unmute_time = int(time.time() + POLL_INTERVAL.total_seconds())
         logger.debug(f"Checking for mutes to remove until {unmute_time}.")
         async with AsyncSessionLocal() as session:
             result = await session.scalars(select(Mute).filter(Mute.unmute_time <= unmute_time))
             mutes = result.all()
             logger.debug(f"Got {len(mutes)} mutes from DB.")
 
-        for guild_id in settings.guild_ids:
-            guild = self.bot.get_guild(guild_id)
-            if not guild:
-                logger.warning(f"Unable to find guild with ID {guild_id}.")
-                continue
-
-            for mute in mutes:
-                run_at = datetime.fromtimestamp(mute.unmute_time)
-                logger.debug(
-                    "Got user_id: {user_id} and unmute timestamp: {unmute_ts} from DB.".format(
-                        user_id=mute.user_id, unmute_ts=run_at
-                    )
-                )
-                member = await self.bot.get_member_or_user(guild, mute.user_id)
-                if not member:
-                    logger.info(f"Member with id: {mute.user_id} not found.")
-                    continue
-                unmute_task = schedule(unmute_member(guild, member), run_at=run_at)
+        due: dict[int, int] = {}
+        for mute in mutes:
+            logger.debug(f"Got user_id: {mute.user_id} and unmute timestamp: {mute.unmute_time} from DB.")
+            due[mute.user_id] = max(due.get(mute.user_id, 0), mute.unmute_time)
+
+        guilds = self._get_guilds()
+        if not guilds:
+            return
+        run_times = {
+            user_id: datetime.fromtimestamp(expires_at)
+            for user_id, expires_at in due.items()
+            if user_id not in self._scheduled_unmutes
+        }
+        self._scheduled_unmutes.update(run_times)
+        try:
+            targets: dict[int, list[tuple[Guild, Member]]] = {user_id: [] for user_id in run_times}
+            for guild in guilds:
+                for user_id, member in (await self._get_members(guild, list(run_times))).items():
+                    targets[user_id].append((guild, member))
+
+            for user_id, run_at in run_times.items():
+                if not targets[user_id]:
+                    logger.info(f"Member with id: {user_id} not found.")
+                unmute_task = schedule(self._unmute(user_id, targets[user_id]), run_at=run_at)
                 unmute_tasks.append(unmute_task)
-                logger.info(f"Scheduled unban task for user_id {mute.user_id} at {str(run_at)}.")
-
-
-        await asyncio.gather(*unmute_tasks)
+                logger.info(f"Scheduled unmute task for user_id {user_id} at {str(run_at)}.")
+
+            results = await asyncio.gather(*unmute_tasks, return_exceptions=True)
+        finally:
+            self._scheduled_unmutes.difference_update(run_times)
+        for user_id, result in zip(run_times, results):
+            if isinstance(result, Exception):
+                logger.error(f"Unmute task for user_id {user_id} failed.", exc_info=result)
 
 
 def setup(bot: Bot) -> None:
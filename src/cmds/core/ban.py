@@ -6,7 +6,6 @@ import discord
 from discord import ApplicationContext, Interaction, WebhookMessage, slash_command
 from discord.ext import commands
 from discord.ext.commands import has_any_role
-from sqlalchemy import select
 
 from src.bot import Bot
 from src.core import settings
@@ -95,17 +94,13 @@ class BanCog(commands.Cog):
     async def approve(self, ctx: ApplicationContext, ban_id: int) -> Interaction | WebhookMessage:
         """Approve a ban request."""
         async with AsyncSessionLocal() as session:
-            ban_to_update = await session.get(Ban, ban_id)
-            if not ban_to_update:
+            ban = await session.get(Ban, ban_id)
+            if not ban:
                 return await ctx.respond("Cannot find record of ban request. Has this user already been unbanned?")
 
-            ban_to_update.approved = True
+            ban.approved = True
             await session.commit()
 
-            stmt = select(Ban).filter(Ban.id == ban_id)
-            result = await session.scalars(stmt)
-            ban: Ban = result.first()
-
         member = await self.bot.get_member_or_user(ctx.guild, ban.user_id)
         if not member:
             return await ctx.respond(f"User {ban.user_id} not found.")
@@ -148,7 +143,7 @@ class BanCog(commands.Cog):
         self.bot.loop.create_task(schedule(unban_member(ctx.guild, member), run_at=new_unban_at))
         return await ctx.respond(
             f"Ban duration updated and approved. "
-            f"The member will be unbanned on {new_unban_at.strftime('%B %d, %Y')} UTC."
+            f"The member will be unbanned on <t:{dur}:D>."
         )
 
     @slash_command(
@@ -1,7 +1,6 @@
 import logging
 from typing import Sequence
 
-import arrow
 from discord import ApplicationContext, Embed, Interaction, SlashCommandGroup, WebhookMessage
 from discord.abc import GuildChannel
 from discord.ext import commands
@@ -13,6 +12,7 @@ from src.bot import Bot
 from src.core import settings
 from src.database.models import Macro
 from src.database.session import AsyncSessionLocal
+from src.helpers.checks import member_is_staff
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +39,7 @@ class MacroCog(commands.Cog):
         name = name.lower()
 
         moderator_id = ctx.user.id
-        today = arrow.utcnow().format("YYYY-MM-DD HH:mm:ss")
-        macro = Macro(user_id=moderator_id, name=name, text=text, created_at=today)
+        macro = Macro(user_id=moderator_id, name=name, text=text)
         async with AsyncSessionLocal() as session:
             try:
                 session.add(macro)
@@ -113,13 +112,7 @@ class MacroCog(commands.Cog):
                                          "Check the list of macros via the command `/macro list`.", ephemeral=True)
 
             if channel:
-                allowed_roles = {role.id for role in ctx.user.roles}
-                required_roles = set(
-                    settings.role_groups.get("ALL_ADMINS", [])
-                    + settings.role_groups.get("ALL_HTB_STAFF", [])
-                    + settings.role_groups.get("ALL_MODS", [])
-                )
-                if allowed_roles & required_roles:
+                if member_is_staff(ctx.user):
                     await channel.send(f"{macro.text}")
                     return await ctx.respond(f"Macro {name} has been sent to {channel.mention}.", ephemeral=True)
                 return await ctx.respond("You don't have permission to send macros in other channels.",
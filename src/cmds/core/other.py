@@ -97,7 +97,7 @@ class SpoilerModal(Modal):
             "type": "spoiler"
         }
 
-        await webhook.webhook_call(webhook_url, data)
+        await webhook.webhook_call(interaction.client.http_session, webhook_url, data)
 
 
 class SpoilerConfirmationView(View):
@@ -181,7 +181,7 @@ class OtherCog(commands.Cog):
             "type": "cheater"
         }
 
-        await webhook.webhook_call(settings.JIRA_WEBHOOK, data)
+        await webhook.webhook_call(self.bot.http_session, settings.JIRA_WEBHOOK, data)
 
         await ctx.respond("Thank you for your report.", ephemeral=True)
 
@@ -213,27 +213,24 @@ class UserCog(commands.Cog):
             if member is None:
                 logger.debug(f"Could not find user by id: {user.id}")
                 return await ctx.respond("Error: Cannot retrieve user.")
+            condition = HtbDiscordLink.discord_user_id == member.id
+            not_found = f"Could not find '{member.id}' as a Discord or HTB ID in the records."
+        else:
+            condition = HtbDiscordLink.htb_user_id == htb_id
+            not_found = f"Could not find with HTB ID {htb_id} in the records."
 
-            async with AsyncSessionLocal() as session:
-                stmt = select(HtbDiscordLink).filter(HtbDiscordLink.discord_user_id == member.id).limit(1)
-                result = await session.scalars(stmt)
-                htb_discord_link: HtbDiscordLink = result.first()
-
-            if not htb_discord_link:
-                return await ctx.respond(f"Could not find '{member.id}' as a Discord or HTB ID in the records.")
-
-        elif htb_id:
-            async with AsyncSessionLocal() as session:
-                stmt = select(HtbDiscordLink).filter(HtbDiscordLink.htb_user_id == htb_id).limit(1)
-                result = await session.scalars(stmt)
-                htb_discord_link: HtbDiscordLink = result.first()
+        async with AsyncSessionLocal() as session:
+            stmt = select(HtbDiscordLink.discord_user_id, HtbDiscordLink.htb_user_id).filter(condition).limit(1)
+            result = await session.execute(stmt)
+            htb_discord_link = result.first()
 
-            if not htb_discord_link:
-                return await ctx.respond(f"Could not find with HTB ID {htb_id} in the records.")
+        if not htb_discord_link:
+            return await ctx.respond(not_found)
 
-        fetched_user = await self.bot.get_member_or_user(ctx.guild, htb_discord_link.discord_user_id_as_int)
         if user:
-            assert fetched_user.id == member.id
+            fetched_user = member
+        else:
+            fetched_user = await self.bot.get_member_or_user(ctx.guild, int(htb_discord_link.discord_user_id))
 
         embed = discord.Embed(title=" ", color=0xB98700)
         if fetched_user.avatar is not None:
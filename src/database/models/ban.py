@@ -1,7 +1,7 @@
 # flake8: noqa: D101
 from datetime import datetime
 
-from sqlalchemy import Boolean, Integer
+from sqlalchemy import Boolean, Index, Integer
 from sqlalchemy.dialects.mysql import BIGINT, TEXT, TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -30,3 +30,8 @@ class Ban(Base):
     approved: Mapped[bool] = mapped_column(Boolean, nullable=False)
     unbanned: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     timestamp: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
+
+    __table_args__ = (
+        Index("ix_ban_unbanned_unban_time", "unbanned", "unban_time"),
+        Index("ix_ban_user_id_unbanned", "user_id", "unbanned"),
+    )
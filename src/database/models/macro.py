@@ -1,7 +1,7 @@
 # flake8: noqa: D101
 from datetime import datetime
 
-from sqlalchemy import Boolean, Integer
+from sqlalchemy import Boolean, Integer, func
 from sqlalchemy.dialects.mysql import BIGINT, TEXT, TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -23,4 +23,4 @@ class Macro(Base):
     user_id: Mapped[int] = mapped_column(BIGINT(18))
     name: Mapped[str] = mapped_column(TEXT, nullable=False, unique=True)
     text: Mapped[str] = mapped_column(TEXT, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, server_default=func.now())
@@ -1,5 +1,5 @@
 # flake8: noqa: D101
-from sqlalchemy import Integer
+from sqlalchemy import Index, Integer
 from sqlalchemy.dialects.mysql import BIGINT, TEXT
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,3 +12,7 @@ class Mute(Base):
     reason: Mapped[str] = mapped_column(TEXT, nullable=False)
     moderator_id: Mapped[int] = mapped_column(BIGINT(18), nullable=False)
     unmute_time: Mapped[int] = mapped_column(BIGINT(11, unsigned=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_mute_unmute_time", "unmute_time"),
+    )
@@ -0,0 +1,44 @@
+"""Helpers for Alembic revisions that have to run against large, live tables."""
+import logging
+
+from sqlalchemy import text
+
+from alembic import op
+
+logger = logging.getLogger(__name__)
+
+LOCK_WAIT_TIMEOUT = 30
+BATCH_SIZE = 1000
+
+
+def set_lock_wait_timeout(seconds: int = LOCK_WAIT_TIMEOUT) -> None:
+    """Abort the migration if a metadata lock cannot be acquired in time, instead of blocking the deploy."""
+    op.execute(f"SET SESSION lock_wait_timeout={int(seconds)}")
+
+
+def create_index_online(name: str, table: str, columns: list[str], unique: bool = False) -> None:
+    """Create an index with online DDL, so the table stays readable and writable while it is built."""
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    op.execute(f"CREATE {kind} {name} ON {table} ({', '.join(columns)}) ALGORITHM=INPLACE LOCK=NONE")
+
+
+def batched_update(statement: str, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Run a data migration `UPDATE` in batches of `batch_size` rows, committing after each batch.
+
+    The statement must exclude already migrated rows in its `WHERE` clause (e.g. `WHERE x IS NULL`),
+    otherwise the loop never terminates.
+
+    Returns:
+        int: The total number of rows updated.
+    """
+    total = 0
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            result = conn.execute(text(f"{statement} LIMIT {int(batch_size)}"))
+            total += result.rowcount
+            logger.debug(f"Batched update touched {result.rowcount} rows ({total} total).")
+            if result.rowcount < batch_size:
+                break
+    return total
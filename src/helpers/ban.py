@@ -16,7 +16,7 @@ from discord import (
     TextChannel,
     ClientUser,
 )
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, select, update
 from sqlalchemy.exc import NoResultFound
 
 from src.bot import Bot
@@ -31,6 +31,11 @@ from src.views.bandecisionview import BanDecisionView
 
 logger = logging.getLogger(__name__)
 
+# Built once so each call only binds `user_id` instead of rebuilding the clause tree.
+_OPEN_BAN_FILTER = (Ban.user_id == bindparam("user_id"), Ban.unbanned.is_(False))
+_OPEN_BAN_STMT = select(Ban).filter(*_OPEN_BAN_FILTER).limit(1)
+_OPEN_BAN_ID_STMT = select(Ban.id).filter(*_OPEN_BAN_FILTER).limit(1)
+
 
 class BanCodes(Enum):
     SUCCESS = "SUCCESS"
@@ -63,13 +68,7 @@ async def _check_member(
 
 async def get_ban(member: Member | User) -> Ban | None:
     async with AsyncSessionLocal() as session:
-        stmt = (
-            select(Ban)
-            .filter(Ban.user_id == member.id, Ban.unbanned.is_(False))
-            .limit(1)
-        )
-        result = await session.scalars(stmt)
-        return result.first()
+        return await session.scalar(_OPEN_BAN_STMT, {"user_id": member.id})
 
 
 async def update_ban(ban: Ban) -> None:
@@ -84,11 +83,12 @@ async def update_ban(ban: Ban) -> None:
 async def _get_ban_or_create(
     member: Member | User, ban: Ban, infraction: Infraction
 ) -> tuple[int, bool]:
-    existing_ban = await get_ban(member)
-    if existing_ban:
-        return existing_ban.id, True
-
+    # Check and insert on the same connection instead of checking one out for each step.
     async with AsyncSessionLocal() as session:
+        existing_ban_id = await session.scalar(_OPEN_BAN_ID_STMT, {"user_id": member.id})
+        if existing_ban_id is not None:
+            return existing_ban_id, True
+
         session.add(ban)
         session.add(infraction)
         await session.commit()
@@ -476,8 +476,18 @@ async def _dm_banned_member(
     return False
 
 
-async def unban_member(guild: Guild, member: Member | User) -> Member | User:
-    """Unban a member from the guild."""
+async def unban_member(guild: Guild, member: Member | User, lift: bool = True) -> Member | User:
+    """
+    Unban a member from the guild.
+
+    Args:
+        guild: The guild to unban the member from
+        member: The member or user to unban
+        lift: Whether to also flag the open ban as lifted, pass False when unbanning from several guilds
+
+    Returns:
+        Member | User: The unbanned member or user
+    """
     try:
         await guild.unban(member)
         logger.info(f"Unbanned user {member.id}.")
@@ -497,23 +507,26 @@ async def unban_member(guild: Guild, member: Member | User) -> Member | User:
             f"HTTPException when trying to unban user with ID {member.id}", exc_info=ex
         )
 
+    if lift:
+        await lift_ban(member.id)
+    return member
+
+
+async def lift_ban(user_id: int) -> None:
+    """Flag the open ban of a user as lifted in the DB."""
     async with AsyncSessionLocal() as session:
-        stmt = (
-            select(Ban)
-            .filter(Ban.user_id == member.id)
-            .filter(Ban.unbanned.is_(False))
-            .limit(1)
+        # Flag the open ban in a single UPDATE instead of loading the row first.
+        result = await session.execute(
+            update(Ban)
+            .where(Ban.user_id == user_id, Ban.unbanned.is_(False))
+            .values(unbanned=True)
+            .execution_options(synchronize_session=False)
         )
-        result = await session.scalars(stmt)
-        ban = result.first()
-        if ban:
-            ban.unbanned = True
-            await session.commit()
-        else:
-            raise NoResultFound(f"Ban not found for user ID {member.id}")
+        if not result.rowcount:
+            raise NoResultFound(f"Ban not found for user ID {user_id}")
+        await session.commit()
 
-    logger.debug(f"Set unbanned to True for user_id: {member.id}")
-    return member
+    logger.debug(f"Set unbanned to True for user_id: {user_id}")
 
 
 async def mute_member(
@@ -560,8 +573,18 @@ async def mute_member(
             await session.commit()
 
 
-async def unmute_member(guild: Guild, member: Member) -> Member:
-    """Unmute a member from the guild."""
+async def unmute_member(guild: Guild, member: Member, lift: bool = True) -> Member:
+    """
+    Unmute a member from the guild.
+
+    Args:
+        guild: The guild to unmute the member in
+        member: The member to unmute
+        lift: Whether to also remove the mute from the DB, pass False when unmuting in several guilds
+
+    Returns:
+        Member: The unmuted member
+    """
     role = guild.get_role(settings.roles.MUTED)
 
     if isinstance(member, Member):
@@ -570,18 +593,22 @@ async def unmute_member(guild: Guild, member: Member) -> Member:
         await member.remove_roles(role)  # type: ignore
         await member.remove_timeout()
 
+    if lift:
+        await lift_mute(member.id)
+    return member
+
+
+async def lift_mute(user_id: int) -> None:
+    """Remove the mutes of a user from the DB."""
     async with AsyncSessionLocal() as session:
-        stmt = select(Mute).filter(Mute.user_id == member.id)
-        result = await session.scalars(stmt)
-        mute = result.first()
-        if mute:
-            await session.delete(mute)
-            await session.commit()
-        else:
-            raise NoResultFound(f"Mute not found for user ID {member.id}")
+        result = await session.execute(
+            delete(Mute).where(Mute.user_id == user_id).execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            raise NoResultFound(f"Mute not found for user ID {user_id}")
+        await session.commit()
 
-    logger.debug(f"Mute removed for user_id: {member.id}")
-    return member
+    logger.debug(f"Mute removed for user_id: {user_id}")
 
 
 async def add_infraction(
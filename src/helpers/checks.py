@@ -7,12 +7,13 @@ from src.core import settings
 logger = logging.getLogger(__name__)
 
 
+STAFF_ROLE_IDS = frozenset(
+    settings.role_groups.get("ALL_ADMINS", [])
+    + settings.role_groups.get("ALL_MODS", [])
+    + settings.role_groups.get("ALL_HTB_STAFF", [])
+)
+
+
 def member_is_staff(member: Member) -> bool:
     """Checks if a member has any of the Administrator or Moderator or Staff roles defined in the RoleIDs class."""
-    role_ids = set([role.id for role in member.roles])
-    staff_role_ids = (
-        set(settings.role_groups.get("ALL_ADMINS"))
-        | set(settings.role_groups.get("ALL_MODS"))
-        | set(settings.role_groups.get("ALL_HTB_STAFF"))
-    )
-    return bool(role_ids.intersection(staff_role_ids))
+    return any(role.id in STAFF_ROLE_IDS for role in member.roles)
@@ -348,7 +348,7 @@ def _get_roles_to_remove(member: Member, guild: Guild, role_manager) -> list[Rol
     try:
         all_ranks = role_manager.get_group_ids("rank") if role_manager else []
         all_positions = role_manager.get_group_ids("position") if role_manager else []
-        removable_role_ids = all_ranks + all_positions
+        removable_role_ids = set(all_ranks) | set(all_positions)
         
         for role in member.roles:
             if role.id in removable_role_ids:
@@ -1,17 +1,24 @@
 """Helper methods to handle webhook calls."""
+import asyncio
 import logging
 
 import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for a single webhook POST, so a hung endpoint cannot block the calling command.
+WEBHOOK_TIMEOUT = aiohttp.ClientTimeout(total=10)
 
-async def webhook_call(url: str, data: dict) -> None:
-    """Send a POST request to the webhook URL with the given data."""
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.post(url, json=data) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to send to webhook: {response.status} - {await response.text()}")
-        except Exception as e:
-            logger.error(f"Failed to send to webhook: {e}")
+
+async def webhook_call(session: aiohttp.ClientSession, url: str, data: dict) -> None:
+    """
+    Send a POST request to the webhook URL with the given data.
+
+    The caller passes the bot's `http_session`, so keep-alive connections to the webhook host are reused.
+    """
+    try:
+        async with session.post(url, json=data, timeout=WEBHOOK_TIMEOUT) as response:
+            if response.status != 200:
+                logger.error(f"Failed to send to webhook: {response.status} - {await response.text()}")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Failed to send to webhook: {e}")
@@ -219,7 +219,6 @@ class RoleManager:
         async with AsyncSessionLocal() as session:
             session.add(role)
             await session.commit()
-            await session.refresh(role)
 
         await self.reload()
         return role
@@ -252,7 +251,6 @@ class RoleManager:
                 return None
             role.discord_role_id = discord_role_id
             await session.commit()
-            await session.refresh(role)
 
         await self.reload()
         return role
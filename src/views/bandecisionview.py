@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 
@@ -16,6 +17,26 @@ from src.helpers.schedule import schedule
 logger = logging.getLogger(__name__)
 
 
+async def _publish_decision(interaction: Interaction, notice: str, content: str, view: View) -> None:
+    """
+    Announce a decision in the SR mod channel and update the decision message, concurrently.
+
+    The decision is already stored when this runs, so a failed send or edit (e.g. the message was deleted) is logged
+    rather than raised, and does not stop the other call.
+    """
+    calls = []
+    channel = interaction.guild.get_channel(settings.channels.SR_MOD)
+    if channel:
+        calls.append(channel.send(notice))
+    if interaction.message:
+        calls.append(interaction.message.edit(content=content, view=view))
+    for result in await asyncio.gather(*calls, return_exceptions=True):
+        if isinstance(result, discord.HTTPException):
+            logger.warning(f"Could not publish ban decision: {result}", exc_info=result)
+        elif isinstance(result, BaseException):
+            raise result
+
+
 class BanDecisionView(View):
     """Persistent view for making decisions on a ban duration.
 
@@ -92,16 +113,12 @@ class BanDecisionView(View):
             f"Ban duration for {member_name} has been approved.", ephemeral=True
         )
 
-        channel = interaction.guild.get_channel(settings.channels.SR_MOD)
-        if channel:
-            await channel.send(
-                f"Ban duration for {member_name} has been approved by {interaction.user.display_name}."
-            )
-
         self._disable_one(f"ban_approve:{self.ban_id}")
-        await interaction.message.edit(
-            content=f"{interaction.user.display_name} has made a decision: **Approved Duration** for {member_name}.",
-            view=self,
+        await _publish_decision(
+            interaction,
+            f"Ban duration for {member_name} has been approved by {interaction.user.display_name}.",
+            f"{interaction.user.display_name} has made a decision: **Approved Duration** for {member_name}.",
+            self,
         )
 
     async def _deny(self, interaction: Interaction) -> None:
@@ -111,11 +128,10 @@ class BanDecisionView(View):
         await interaction.response.defer(ephemeral=True)
 
         async with AsyncSessionLocal() as session:
-            ban = await session.get(Ban, self.ban_id)
-            if not ban:
-                await interaction.followup.send("Ban record not found.", ephemeral=True)
-                return
-            user_id = ban.user_id
+            user_id = await session.scalar(select(Ban.user_id).filter(Ban.id == self.ban_id))
+        if user_id is None:
+            await interaction.followup.send("Ban record not found.", ephemeral=True)
+            return
 
         member = await self.bot.get_member_or_user(interaction.guild, user_id)
 
@@ -135,17 +151,13 @@ class BanDecisionView(View):
             ephemeral=True,
         )
 
-        channel = interaction.guild.get_channel(settings.channels.SR_MOD)
-        if channel:
-            await channel.send(
-                f"Ban for {member_name} has been denied by {interaction.user.display_name} "
-                f"and the member has been unbanned."
-            )
-
         self._disable_all()
-        await interaction.message.edit(
-            content=f"{interaction.user.display_name} has made a decision: **Denied and Unbanned** for {member_name}.",
-            view=self,
+        await _publish_decision(
+            interaction,
+            f"Ban for {member_name} has been denied by {interaction.user.display_name} "
+            f"and the member has been unbanned.",
+            f"{interaction.user.display_name} has made a decision: **Denied and Unbanned** for {member_name}.",
+            self,
         )
 
     async def _dispute(self, interaction: Interaction) -> None:
@@ -206,23 +218,18 @@ class DisputeModal(Modal):
 
         await interaction.response.send_message(
             f"Ban duration updated to {new_duration_str}. "
-            f"The member will be unbanned on {new_unban_at.strftime('%B %d, %Y')} UTC.",
+            f"The member will be unbanned on <t:{dur}:D>.",
             ephemeral=True,
         )
 
-        channel = interaction.guild.get_channel(settings.channels.SR_MOD)
-        if channel:
-            await channel.send(
-                f"Ban duration for {member_name} updated to {new_duration_str}. "
-                f"Unban scheduled for {new_unban_at.strftime('%B %d, %Y')} UTC."
-            )
-
         self.parent_view._disable_all()
-        if interaction.message:
-            await interaction.message.edit(
-                content=f"{interaction.user.display_name} has made a decision: **Disputed Duration** for {member_name}.",
-                view=self.parent_view,
-            )
+        await _publish_decision(
+            interaction,
+            f"Ban duration for {member_name} updated to {new_duration_str}. "
+            f"Unban scheduled for <t:{dur}:D>.",
+            f"{interaction.user.display_name} has made a decision: **Disputed Duration** for {member_name}.",
+            self.parent_view,
+        )
 
 
 async def register_ban_views(bot: Bot) -> None:
@@ -232,12 +239,12 @@ async def register_ban_views(bot: Bot) -> None:
     existing ban-decision messages continue to work after a restart.
     """
     async with AsyncSessionLocal() as session:
-        stmt = select(Ban).filter(Ban.approved.is_(False), Ban.unbanned.is_(False))
+        stmt = select(Ban.id).filter(Ban.approved.is_(False), Ban.unbanned.is_(False))
         result = await session.scalars(stmt)
-        bans = result.all()
+        ban_ids = result.all()
 
-    for ban in bans:
-        bot.add_view(BanDecisionView(ban.id, bot))
+    for ban_id in ban_ids:
+        bot.add_view(BanDecisionView(ban_id, bot))
 
-    if bans:
-        logger.info("Registered %d persistent ban decision view(s).", len(bans))
+    if ban_ids:
+        logger.info("Registered %d persistent ban decision view(s).", len(ban_ids))
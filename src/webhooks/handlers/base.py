@@ -147,14 +147,15 @@ class BaseHandler(ABC):
         """
         # Get all roles from the group as Discord Role objects
         group_roles = [
-            bot.guilds[0].get_role(role_id)
-            for role_id in role_group
-            if bot.guilds[0].get_role(role_id)
+            role
+            for role in (bot.guilds[0].get_role(role_id) for role_id in role_group)
+            if role
         ]
+        group_role_ids = {role.id for role in group_roles}
 
         # Find current role from this group that the member has
         current_role = next(
-            (role for role in member.roles if role in group_roles), None
+            (role for role in member.roles if role.id in group_role_ids), None
         )
 
         # Get the new role object if specified
@@ -165,7 +166,7 @@ class BaseHandler(ABC):
                 raise ValueError(f"Invalid role ID: {new_role_id}")
 
             # Verify the new role is in the allowed group
-            if new_role not in group_roles:
+            if new_role.id not in group_role_ids:
                 raise ValueError(
                     f"Role {new_role_id} is not in the specified role group"
                 )
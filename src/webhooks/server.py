@@ -2,6 +2,7 @@ import hashlib
 import hmac
 import logging
 import json
+from functools import lru_cache
 from typing import Any, Dict
 
 from fastapi import FastAPI, HTTPException, Request
@@ -20,6 +21,12 @@ logger = logging.getLogger(__name__)
 app = FastAPI()
 
 
+@lru_cache(maxsize=4)
+def _hmac_template(secret: str) -> hmac.HMAC:
+    """Key an HMAC once per secret, so each request only copies it instead of re-deriving the key."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha1)
+
+
 def verify_signature(body: dict, signature: str, secret: str) -> bool:
     """
     HMAC SHA1 signature verification.
@@ -35,7 +42,9 @@ def verify_signature(body: dict, signature: str, secret: str) -> bool:
     if not signature:
         return False
 
-    digest = hmac.new(secret.encode(), body, hashlib.sha1).hexdigest()  # type: ignore
+    mac = _hmac_template(secret).copy()
+    mac.update(body)  # type: ignore
+    digest = mac.digest().hex()
     return hmac.compare_digest(signature, digest)
 
 
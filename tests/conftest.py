@@ -1,7 +1,7 @@
 from unittest.mock import AsyncMock
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests import helpers
 
@@ -58,18 +58,6 @@ def content():
 
 
 @pytest.fixture
-def session(mocker):
-    class AsyncContextManager:
-        async def __aenter__(self):
-            return session
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
-    # Mock the AsyncSession class
-    session = AsyncMock(spec=AsyncSession)
-
-    # Mock the async_sessionmaker
-    async_sessionmaker_mock = mocker.MagicMock(spec=async_sessionmaker)
-    async_sessionmaker_mock.return_value = AsyncContextManager()
-    return async_sessionmaker_mock
+def session():
+    # A mocked AsyncSession, as handed out by `async with AsyncSessionLocal() as session`.
+    return AsyncMock(spec=AsyncSession)
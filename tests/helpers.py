@@ -507,6 +507,7 @@ class MockContext(CustomMockMixin, mock.MagicMock):
         self.channel = kwargs.get('channel', MockTextChannel())
         self.message = kwargs.get('message', MockMessage())
         self.respond = mock.AsyncMock()
+        self.defer = mock.AsyncMock()
         self.followup = mock.MagicMock()
         self.followup.send = mock.AsyncMock()
 
@@ -624,3 +625,34 @@ class MockAsyncWebhook(CustomMockMixin, mock.MagicMock):
     """
     spec_set = webhook_instance
     additional_spec_asyncs = ("send", "edit", "delete", "execute")
+
+
+class MockScalarsResult:
+    """Stand-in for the `ScalarResult` returned by `session.scalars()`; `first()` and `all()` return the given value."""
+
+    def __init__(self, return_value):
+        self.return_value = return_value
+
+    def first(self):
+        return self.return_value
+
+    def all(self):
+        return self.return_value
+
+
+class MockSessionContext:
+    """A minimal `async with` wrapper around a mocked session, without the cost of extra `AsyncMock` layers."""
+
+    def __init__(self, session: mock.AsyncMock) -> None:
+        self.session = session
+
+    async def __aenter__(self) -> mock.AsyncMock:
+        return self.session
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+def mock_session_context(session: mock.AsyncMock) -> MockSessionContext:
+    """Wrap a mocked session so it can be returned by `AsyncSessionLocal()` and used as `async with ... as s`."""
+    return MockSessionContext(session)
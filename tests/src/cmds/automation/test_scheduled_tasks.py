@@ -0,0 +1,339 @@
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from discord import NotFound
+
+from src.cmds.automation import scheduled_tasks
+from src.core import settings
+from tests import helpers
+
+
+def _session_ctx(rows: list) -> helpers.MockSessionContext:
+    """Wrap a mocked session returning *rows* so it works as ``async with AsyncSessionLocal() as s``."""
+    session = AsyncMock()
+    session.scalars = AsyncMock(return_value=helpers.MockScalarsResult(rows))
+    return helpers.mock_session_context(session)
+
+
+def _lift_session_ctx(*user_ids: int) -> helpers.MockSessionContext:
+    """Session for `lift_ban`/`lift_mute` holding one open row per user, a second lift of a user matches nothing."""
+    open_rows = set(user_ids)
+
+    def execute(stmt):
+        user_id = next(v for k, v in stmt.compile().params.items() if k.startswith("user_id"))
+        rowcount = int(user_id in open_rows)
+        open_rows.discard(user_id)
+        return MagicMock(rowcount=rowcount)
+
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=execute)
+    return helpers.mock_session_context(session)
+
+
+def _make_row(user_id: int, expires_at: int = 1700000000) -> MagicMock:
+    """Build a mock Ban/Mute row with the attributes the scheduled tasks read."""
+    row = MagicMock()
+    row.user_id = user_id
+    row.unban_time = expires_at
+    row.unmute_time = expires_at
+    return row
+
+
+def _make_guild(
+    cached: list | None = None, queried: list | None = None, banned: list | None = None, id_: int = 1
+) -> helpers.MockGuild:
+    """Build a mock guild with *cached* members, *queried* members found over the gateway and *banned* users."""
+    guild = helpers.MockGuild(id=id_)
+    cache = {member.id: member for member in cached or []}
+    guild.get_member = MagicMock(side_effect=cache.get)
+    guild.query_members = AsyncMock(return_value=queried or [])
+    bans = {user.id: user for user in banned or []}
+
+    async def fetch_ban(user):
+        if user.id not in bans:
+            raise NotFound(MagicMock(), "Unknown Ban")
+        return MagicMock(user=bans[user.id])
+
+    guild.fetch_ban = AsyncMock(side_effect=fetch_ban)
+    return guild
+
+
+@pytest.fixture
+def cog(bot):
+    with patch.object(scheduled_tasks.tasks.Loop, "start"):
+        return scheduled_tasks.ScheduledTasks(bot)
+
+
+class TestScheduledTasks:
+    """Test the `ScheduledTasks` cog."""
+
+    @pytest.mark.asyncio
+    async def test_auto_unban_lifts_each_ban_once_across_guilds(self, bot, cog):
+        first, second = helpers.MockUser(id=42), helpers.MockUser(id=43)
+        guilds = {1: _make_guild(banned=[first, second], id_=1), 2: _make_guild(banned=[first], id_=2)}
+        bot.get_guild = MagicMock(side_effect=guilds.get)
+        lift_ctx = _lift_session_ctx(42, 43)
+        rows = [_make_row(42), _make_row(42), _make_row(43)]
+
+        with (
+            patch.object(settings, "guild_ids", [1, 2]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx(rows)),
+            patch("src.helpers.ban.AsyncSessionLocal", return_value=lift_ctx),
+        ):
+            await cog.auto_unban()
+
+        assert guilds[1].unban.await_args_list == [((first,),), ((second,),)]
+        guilds[2].unban.assert_awaited_once_with(first)
+        assert lift_ctx.session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_auto_unban_uses_latest_expiry_per_user(self, bot, cog):
+        bot.get_guild = MagicMock(return_value=_make_guild(banned=[helpers.MockUser(id=42)]))
+        rows = [_make_row(42, 1700000000), _make_row(42, 1700003600), _make_row(42, 1700001800)]
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx(rows)),
+            patch.object(cog, "_unban", new=MagicMock()),
+            patch.object(scheduled_tasks, "schedule", new_callable=AsyncMock) as schedule_mock,
+        ):
+            await cog.auto_unban()
+
+        schedule_mock.assert_called_once()
+        assert schedule_mock.call_args.kwargs["run_at"] == datetime.fromtimestamp(1700003600)
+
+    @pytest.mark.asyncio
+    async def test_auto_unban_lifts_ban_of_user_no_longer_banned(self, bot, cog):
+        guild = _make_guild()
+        bot.get_guild = MagicMock(return_value=guild)
+        lift_ctx = _lift_session_ctx(42)
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx([_make_row(42)])),
+            patch("src.helpers.ban.AsyncSessionLocal", return_value=lift_ctx),
+        ):
+            await cog.auto_unban()
+
+        guild.unban.assert_not_awaited()
+        lift_ctx.session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_auto_unmute_lifts_each_mute_once_across_guilds(self, bot, cog):
+        member = helpers.MockMember(id=42)
+        guilds = {1: _make_guild(cached=[member], id_=1), 2: _make_guild(cached=[member], id_=2)}
+        bot.get_guild = MagicMock(side_effect=guilds.get)
+        lift_ctx = _lift_session_ctx(42)
+
+        with (
+            patch.object(settings, "guild_ids", [1, 2]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx([_make_row(42)])),
+            patch("src.helpers.ban.AsyncSessionLocal", return_value=lift_ctx),
+        ):
+            await cog.auto_unmute()
+
+        assert member.remove_roles.await_count == 2
+        lift_ctx.session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_auto_unmute_converts_run_times_once_for_all_guilds(self, bot, cog):
+        member = helpers.MockMember(id=42)
+        bot.get_guild = MagicMock(return_value=_make_guild(cached=[member]))
+
+        with (
+            patch.object(settings, "guild_ids", [1, 2]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx([_make_row(42)])),
+            patch("src.helpers.ban.AsyncSessionLocal", return_value=_lift_session_ctx(42)),
+            patch.object(scheduled_tasks, "datetime", wraps=datetime) as datetime_mock,
+        ):
+            await cog.auto_unmute()
+
+        datetime_mock.fromtimestamp.assert_called_once_with(1700000000)
+
+    @pytest.mark.asyncio
+    async def test_auto_unmute_prefers_guild_cache(self, bot, cog):
+        member = helpers.MockMember(id=42)
+        guild = _make_guild(cached=[member])
+        bot.get_guild = MagicMock(return_value=guild)
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx([_make_row(42)])),
+            patch.object(scheduled_tasks, "unmute_member", new_callable=AsyncMock) as unmute_mock,
+            patch.object(scheduled_tasks, "lift_mute", new_callable=AsyncMock),
+        ):
+            await cog.auto_unmute()
+
+        guild.query_members.assert_not_awaited()
+        unmute_mock.assert_awaited_once_with(guild, member, lift=False)
+
+    @pytest.mark.asyncio
+    async def test_auto_unmute_queries_uncached_members_in_one_request(self, bot, cog):
+        cached, queried = helpers.MockMember(id=42), helpers.MockMember(id=43)
+        guild = _make_guild(cached=[cached], queried=[queried])
+        bot.get_guild = MagicMock(return_value=guild)
+        rows = [_make_row(42), _make_row(43)]
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx(rows)),
+            patch.object(scheduled_tasks, "unmute_member", new_callable=AsyncMock) as unmute_mock,
+            patch.object(scheduled_tasks, "lift_mute", new_callable=AsyncMock),
+        ):
+            await cog.auto_unmute()
+
+        guild.query_members.assert_awaited_once_with(user_ids=[43], limit=100, cache=True)
+        assert unmute_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_auto_unban_skips_missing_guild(self, bot, cog):
+        bot.get_guild = MagicMock(return_value=None)
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx([_make_row(42)])),
+            patch.object(scheduled_tasks, "lift_ban", new_callable=AsyncMock) as lift_mock,
+        ):
+            await cog.auto_unban()
+
+        lift_mock.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_auto_unban_only_fetches_bans_due_before_next_tick(self, bot, cog):
+        bot.get_guild = MagicMock(return_value=None)
+        session_ctx = _session_ctx([])
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=session_ctx),
+        ):
+            await cog.auto_unban()
+
+        stmt = session_ctx.session.scalars.call_args[0][0]
+        bound = max(v for v in stmt.compile().params.values() if isinstance(v, int))
+        assert time.time() < bound <= time.time() + scheduled_tasks.POLL_INTERVAL.total_seconds()
+
+    @pytest.mark.asyncio
+    async def test_auto_unmute_lifts_mute_of_unknown_member(self, bot, cog):
+        bot.get_guild = MagicMock(return_value=_make_guild())
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx([_make_row(42)])),
+            patch.object(scheduled_tasks, "unmute_member", new_callable=AsyncMock) as unmute_mock,
+            patch.object(scheduled_tasks, "lift_mute", new_callable=AsyncMock) as lift_mock,
+        ):
+            await cog.auto_unmute()
+
+        unmute_mock.assert_not_awaited()
+        lift_mock.assert_awaited_once_with(42)
+
+    @pytest.mark.asyncio
+    async def test_auto_unmute_treats_already_lifted_mute_as_done(self, bot, cog):
+        member = helpers.MockMember(id=42)
+        bot.get_guild = MagicMock(return_value=_make_guild(cached=[member]))
+        # The timer started by /mute lifted the row before the poll got to it.
+        lift_ctx = _lift_session_ctx()
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx([_make_row(42)])),
+            patch("src.helpers.ban.AsyncSessionLocal", return_value=lift_ctx),
+            patch.object(scheduled_tasks.logger, "error") as error_mock,
+        ):
+            await cog.auto_unmute()
+
+        lift_ctx.session.execute.assert_awaited_once()
+        error_mock.assert_not_called()
+        assert not cog._scheduled_unmutes
+
+    @pytest.mark.asyncio
+    async def test_auto_unban_skips_users_already_scheduled(self, bot, cog):
+        guild = _make_guild(banned=[helpers.MockUser(id=42)])
+        bot.get_guild = MagicMock(return_value=guild)
+        cog._scheduled_unbans.add(42)
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx([_make_row(42)])),
+            patch.object(scheduled_tasks, "lift_ban", new_callable=AsyncMock) as lift_mock,
+        ):
+            await cog.auto_unban()
+
+        guild.fetch_ban.assert_not_awaited()
+        lift_mock.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_auto_unban_logs_failed_task(self, bot, cog):
+        bot.get_guild = MagicMock(return_value=_make_guild(banned=[helpers.MockUser(id=42)]))
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", return_value=_session_ctx([_make_row(42)])),
+            patch.object(scheduled_tasks, "lift_ban", new_callable=AsyncMock, side_effect=RuntimeError("db down")),
+            patch.object(scheduled_tasks.logger, "error") as error_mock,
+        ):
+            await cog.auto_unban()
+
+        error_mock.assert_called_once()
+        assert not cog._scheduled_unbans
+
+    @pytest.mark.asyncio
+    async def test_all_tasks_handles_ban_lifted_by_its_own_timer(self, bot, cog):
+        user = helpers.MockUser(id=42)
+        guild = _make_guild(banned=[user])
+        bot.get_guild = MagicMock(return_value=guild)
+        # Due within the seconds cut-off, but the timer started by /ban already flagged the row.
+        row = _make_row(42, int(time.time()))
+
+        with (
+            patch.object(settings, "guild_ids", [1]),
+            patch.object(scheduled_tasks, "AsyncSessionLocal", side_effect=lambda: _session_ctx([row])),
+            patch("src.helpers.ban.AsyncSessionLocal", return_value=_lift_session_ctx()),
+            patch.object(scheduled_tasks.logger, "error") as error_mock,
+        ):
+            await cog.all_tasks()
+
+        guild.unban.assert_awaited_once_with(user)
+        error_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_all_tasks_survives_failing_task(self, cog):
+        with (
+            patch.object(cog, "auto_unban", new_callable=AsyncMock, side_effect=RuntimeError("db down")),
+            patch.object(cog, "auto_unmute", new_callable=AsyncMock) as unmute_mock,
+            patch.object(scheduled_tasks.logger, "error") as error_mock,
+        ):
+            await cog.all_tasks()
+
+        unmute_mock.assert_awaited_once()
+        error_mock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_all_tasks_runs_unban_and_unmute_concurrently(self, cog):
+        started = []
+        both_started = asyncio.Event()
+
+        async def task(name):
+            # Only returns once both tasks are running, so running them one after the other times out.
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await both_started.wait()
+
+        with (
+            patch.object(cog, "auto_unban", new=lambda: task("unban")),
+            patch.object(cog, "auto_unmute", new=lambda: task("unmute")),
+        ):
+            await asyncio.wait_for(cog.all_tasks(), timeout=1)
+
+        assert sorted(started) == ["unban", "unmute"]
+
+    def test_setup(self, bot):
+        with patch.object(scheduled_tasks.tasks.Loop, "start"):
+            scheduled_tasks.setup(bot)
+
+        bot.add_cog.assert_called_once()
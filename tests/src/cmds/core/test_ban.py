@@ -1,10 +1,11 @@
 import calendar
 import time
 from datetime import date
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from discord import Forbidden
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.cmds.core import ban
 from src.database.models import Ban, Infraction
@@ -170,15 +171,36 @@ class TestBanCog:
         # Define a mock ban record in the database
         ban_record = Ban(id=1, user_id=1, reason="No reason", moderator_id=2)
 
-        async with AsyncMock() as mock:
-            mock.get.return_value = ban_record
+        session = AsyncMock()
+        session.get.return_value = ban_record
 
-            with patch('src.cmds.core.ban.AsyncSessionLocal', return_value=mock):
-                # Call the deny command and check the response
-                cog = ban.BanCog(bot)
-                await cog.deny.callback(cog, ctx, ban_record.id)
+        with patch('src.cmds.core.ban.AsyncSessionLocal', return_value=helpers.mock_session_context(session)):
+            # Call the deny command and check the response
+            cog = ban.BanCog(bot)
+            await cog.deny.callback(cog, ctx, ban_record.id)
 
-                ctx.respond.assert_called_once_with("Ban request denied. The user has been unbanned.")
+        session.delete.assert_awaited_once_with(ban_record)
+        ctx.respond.assert_called_once_with("Ban request denied. The user has been unbanned.")
+
+    @pytest.mark.asyncio
+    async def test_approve_success(self, ctx, bot):
+        ban_record = Ban(id=1, user_id=1, reason="No reason", moderator_id=2, unban_time=1700000000)
+        session = AsyncMock()
+        session.get.return_value = ban_record
+        bot.get_member_or_user = AsyncMock(return_value=helpers.MockMember(id=1))
+
+        with (
+            patch('src.cmds.core.ban.AsyncSessionLocal', return_value=helpers.mock_session_context(session)),
+            patch('src.cmds.core.ban.schedule', new_callable=MagicMock),
+            patch('src.cmds.core.ban.unban_member', new_callable=MagicMock),
+        ):
+            cog = ban.BanCog(bot)
+            await cog.approve.callback(cog, ctx, ban_record.id)
+
+        assert ban_record.approved is True
+        session.commit.assert_awaited_once()
+        session.scalars.assert_not_called()
+        ctx.respond.assert_called_once_with("Ban approval has been recorded.")
 
     @pytest.mark.asyncio
     async def test_warn_success(self, ctx, bot):
@@ -257,15 +279,16 @@ class TestBanCog:
             id=1, user_id=1, reason="No reason", weight=10, moderator_id=2, date=date.today()
         )
 
-        async with AsyncMock() as mock:
-            mock.get.return_value = infraction_record
+        session = AsyncMock()
+        session.get.return_value = infraction_record
 
-            with patch('src.cmds.core.ban.AsyncSessionLocal', return_value=mock):
-                # Call the remove_infraction command and check the response
-                cog = ban.BanCog(bot)
-                await cog.remove_infraction.callback(cog, ctx, infraction_record.id)
+        with patch('src.cmds.core.ban.AsyncSessionLocal', return_value=helpers.mock_session_context(session)):
+            # Call the remove_infraction command and check the response
+            cog = ban.BanCog(bot)
+            await cog.remove_infraction.callback(cog, ctx, infraction_record.id)
 
-                ctx.respond.assert_called_once_with(f"Infraction record #{infraction_record.id} has been deleted.")
+        session.delete.assert_awaited_once_with(infraction_record)
+        ctx.respond.assert_called_once_with(f"Infraction record #{infraction_record.id} has been deleted.")
 
 
     @pytest.mark.asyncio
@@ -274,9 +297,8 @@ class TestBanCog:
         bot.get_member_or_user.return_value = member
 
         # Patch the AsyncSessionLocal to simulate database interaction
-        async with AsyncMock() as mock_session:
-            with patch('src.helpers.ban.AsyncSessionLocal', return_value=mock_session):
-                response = await add_infraction(guild, member, 10, "Test infraction reason", author)
+        with patch('src.helpers.ban.AsyncSessionLocal', return_value=helpers.mock_session_context(AsyncMock(spec=AsyncSession))):
+            response = await add_infraction(guild, member, 10, "Test infraction reason", author)
 
         # Assertions
         assert response.message == f"{member.mention} ({member.id}) has been warned with a strike weight of 10."
@@ -295,9 +317,8 @@ class TestBanCog:
         bot.get_member_or_user.return_value = member
 
         # Patch the AsyncSessionLocal to simulate database interaction
-        async with AsyncMock() as mock_session:
-            with patch('src.helpers.ban.AsyncSessionLocal', return_value=mock_session):
-                response = await add_infraction(guild, member, 10, "Test infraction reason", author)
+        with patch('src.helpers.ban.AsyncSessionLocal', return_value=helpers.mock_session_context(AsyncMock(spec=AsyncSession))):
+            response = await add_infraction(guild, member, 10, "Test infraction reason", author)
 
         # Assertions
         assert response.message == "Could not DM member due to privacy settings, however the infraction was still added."
@@ -309,9 +330,8 @@ class TestBanCog:
         bot.get_member_or_user.return_value = member
 
         # Patch the AsyncSessionLocal to simulate database interaction
-        async with AsyncMock() as mock_session:
-            with patch('src.helpers.ban.AsyncSessionLocal', return_value=mock_session):
-                response = await add_infraction(guild, member, 10, "", author)
+        with patch('src.helpers.ban.AsyncSessionLocal', return_value=helpers.mock_session_context(AsyncMock(spec=AsyncSession))):
+            response = await add_infraction(guild, member, 10, "", author)
 
         # Assertions
         assert response.message == f"{member.mention} ({member.id}) has been warned with a strike weight of 10."
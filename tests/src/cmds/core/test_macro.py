@@ -11,18 +11,9 @@ from src.bot import Bot
 from src.cmds.core.macro import MacroCog
 from src.core import settings
 from src.database.models import Macro
+from tests import helpers
 
 
-class MockScalarsResult:
-    def __init__(self, return_value):
-        self.return_value = return_value
-
-    def first(self):
-        return self.return_value
-
-    def all(self):
-        return self.return_value
-
 @pytest.fixture
 def bot():
     return MagicMock(spec=Bot)
@@ -42,27 +33,13 @@ def ctx():
 @pytest.fixture
 def mock_session():
     session = AsyncMock(spec=AsyncSession)
-
-    # Configure the session methods
-    session.add = AsyncMock()
-    session.commit = AsyncMock()
-    session.delete = AsyncMock()
-    session.close = AsyncMock()
-
-    async def mock_scalars(stmt):
-        return MockScalarsResult([])
-
-    session.scalars = AsyncMock(side_effect=mock_scalars)
+    session.scalars = AsyncMock(return_value=helpers.MockScalarsResult([]))
 
     return session
 
 @pytest.fixture(autouse=True)
 def mock_session_maker(mock_session):
-    with patch('src.cmds.core.macro.AsyncSessionLocal') as mock:
-        cm = AsyncMock()
-        cm.__aenter__.return_value = mock_session
-        cm.__aexit__.return_value = None
-        mock.return_value = cm
+    with patch('src.cmds.core.macro.AsyncSessionLocal', return_value=helpers.mock_session_context(mock_session)) as mock:
         yield mock
 
 @pytest.mark.asyncio
@@ -70,8 +47,6 @@ async def test_add_macro_success(cog, ctx, mock_session):
     # Setup
     name = "test_macro"
     text = "This is a test macro"
-    # Configure mock to return None for the duplicate check
-    mock_session.scalars.return_value.first.return_value = None
 
     # Execute
     await cog.add.callback(cog, ctx, name=name, text=text)
@@ -130,7 +105,7 @@ async def test_edit_macro_success(cog, ctx, mock_session):
     macro_id = 1
     new_text = "Updated macro text"
     mock_macro = Macro(id=macro_id, name="test", text="old text")
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult(mock_macro))
 
     # Execute
     await cog.edit.callback(cog, ctx, macro_id=macro_id, text=new_text)
@@ -145,7 +120,7 @@ async def test_edit_macro_success(cog, ctx, mock_session):
 async def test_edit_macro_not_found(cog, ctx, mock_session):
     # Setup
     macro_id = 999
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(None))
+    mock_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult(None))
 
     # Execute
     await cog.edit.callback(cog, ctx, macro_id=macro_id, text="new text")
@@ -183,7 +158,7 @@ async def test_list_macros_success(cog, ctx, mock_session):
 @pytest.mark.asyncio
 async def test_list_macros_empty(cog, ctx, mock_session):
     # Setup
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult([]))
+    mock_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult([]))
 
     # Execute
     await cog.list.callback(cog, ctx)
@@ -197,7 +172,7 @@ async def test_send_macro_success(cog, ctx, mock_session):
     name = "test_macro"
     text = "Macro text"
     mock_macro = Macro(name=name, text=text)
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult(mock_macro))
 
     # Execute
     await cog.send.callback(cog, ctx, name=name)
@@ -209,7 +184,7 @@ async def test_send_macro_success(cog, ctx, mock_session):
 async def test_send_macro_not_found(cog, ctx, mock_session):
     # Setup
     name = "nonexistent"
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(None))
+    mock_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult(None))
 
     # Execute
     await cog.send.callback(cog, ctx, name=name)
@@ -226,7 +201,7 @@ async def test_send_macro_to_channel_success(cog, ctx, mock_session):
     mock_macro = Macro(name=name, text=text)
     mock_channel = AsyncMock()
     mock_channel.mention = "#test-channel"
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult(mock_macro))
 
     # Mock admin role
     ctx.user.roles = [MagicMock(id=settings.role_groups["ALL_ADMINS"][0])]
@@ -245,7 +220,7 @@ async def test_send_macro_to_channel_no_permission(cog, ctx, mock_session):
     text = "Macro text"
     mock_macro = Macro(name=name, text=text)
     mock_channel = AsyncMock()
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult(mock_macro))
 
     # Mock regular user role
     ctx.user.roles = [MagicMock(id=0)]
@@ -266,7 +241,7 @@ async def test_send_macro_channel_error(cog, ctx, mock_session):
     mock_channel = AsyncMock()
     mock_channel.send.side_effect = Exception("Channel error")
     mock_channel.mention = "#test-channel"
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult(mock_macro))
 
     # Mock admin role
     ctx.user.roles = [MagicMock(id=settings.role_groups["ALL_ADMINS"][0])]
@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from discord import ApplicationContext
@@ -19,16 +20,16 @@ class TestWebhookHelper:
         test_url = "http://test.webhook.url"
         test_data = {"key": "value"}
 
-        # Mock the aiohttp ClientSession
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_post.return_value.__aenter__.return_value = mock_response
+        # Mock the bot's aiohttp ClientSession
+        session = MagicMock()
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        session.post.return_value.__aenter__.return_value = mock_response
 
-            await webhook.webhook_call(test_url, test_data)
+        await webhook.webhook_call(session, test_url, test_data)
 
-            # Verify the post was called with correct parameters
-            mock_post.assert_called_once_with(test_url, json=test_data)
+        # Verify the post was called with correct parameters
+        session.post.assert_called_once_with(test_url, json=test_data, timeout=webhook.WEBHOOK_TIMEOUT)
 
     @pytest.mark.asyncio
     async def test_webhook_call_failure(self):
@@ -36,15 +37,23 @@ class TestWebhookHelper:
         test_url = "http://test.webhook.url"
         test_data = {"key": "value"}
 
-        # Mock the aiohttp ClientSession
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            mock_response = AsyncMock()
-            mock_response.status = 500
-            mock_response.text = AsyncMock(return_value="Internal Server Error")
-            mock_post.return_value.__aenter__.return_value = mock_response
+        # Mock the bot's aiohttp ClientSession
+        session = MagicMock()
+        mock_response = AsyncMock()
+        mock_response.status = 500
+        mock_response.text = AsyncMock(return_value="Internal Server Error")
+        session.post.return_value.__aenter__.return_value = mock_response
 
-            # Test should complete without raising an exception
-            await webhook.webhook_call(test_url, test_data)
+        # Test should complete without raising an exception
+        await webhook.webhook_call(session, test_url, test_data)
+
+    @pytest.mark.asyncio
+    async def test_webhook_call_timeout(self):
+        """Test a timed out webhook call is logged instead of raised."""
+        session = MagicMock()
+        session.post.side_effect = asyncio.TimeoutError
+
+        await webhook.webhook_call(session, "http://test.webhook.url", {})
 
 
 class TestOther:
@@ -138,6 +147,7 @@ class TestOther:
 
             # Verify webhook was called with correct data
             mock_webhook.assert_called_once_with(
+                interaction.client.http_session,
                 settings.JIRA_WEBHOOK,
                 {
                     "user": "TestUser",
@@ -162,6 +172,7 @@ class TestOther:
 
             # Verify the webhook was called with correct data
             mock_webhook.assert_called_once_with(
+                bot.http_session,
                 settings.JIRA_WEBHOOK,
                 {
                     "user": "ReporterUser",
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from discord.errors import Forbidden, HTTPException
@@ -57,14 +57,13 @@ class TestUserCog:
         left_user = helpers.MockUser(id=user_to_kick.id, name="User to Kick")
         bot.get_member_or_user = AsyncMock(return_value=left_user)
 
-        with patch('src.cmds.core.user.member_is_staff', return_value=False):
-            cog = user.UserCog(bot)
-            await cog.kick.callback(cog, ctx, user_to_kick, "Violation of rules")
+        cog = user.UserCog(bot)
+        await cog.kick.callback(cog, ctx, user_to_kick, "Violation of rules")
 
-            bot.get_member_or_user.assert_called_once_with(ctx.guild, user_to_kick.id)
-            ctx.guild.kick.assert_not_called()
-            ctx.defer.assert_awaited_once_with(ephemeral=False)
-            ctx.followup.send.assert_called_once_with("User seems to have already left the server.")
+        bot.get_member_or_user.assert_called_once_with(ctx.guild, user_to_kick.id)
+        ctx.guild.kick.assert_not_called()
+        ctx.defer.assert_awaited_once_with(ephemeral=False)
+        ctx.followup.send.assert_called_once_with("User seems to have already left the server.")
 
     @pytest.mark.asyncio
     async def test_kick_fail_user_not_found(self, ctx, guild, bot, session):
@@ -74,9 +73,8 @@ class TestUserCog:
         ctx.guild.kick = AsyncMock()
         bot.get_member_or_user = AsyncMock(return_value=None)
 
-        with patch('src.cmds.core.user.member_is_staff', return_value=False):
-            cog = user.UserCog(bot)
-            await cog.kick.callback(cog, ctx, user_to_kick, "Violation of rules")
+        cog = user.UserCog(bot)
+        await cog.kick.callback(cog, ctx, user_to_kick, "Violation of rules")
 
         bot.get_member_or_user.assert_called_once_with(ctx.guild, user_to_kick.id)
         ctx.guild.kick.assert_not_called()
@@ -134,10 +132,7 @@ class TestUserCog:
         ctx.guild.kick = AsyncMock()
         bot.get_member_or_user = AsyncMock(return_value=member)
 
-        with (
-            patch('src.cmds.core.user.add_infraction', new_callable=AsyncMock),
-            patch('src.cmds.core.user.member_is_staff', return_value=False)
-        ):
+        with patch('src.cmds.core.user.member_is_staff', return_value=False):
             cog = user.UserCog(bot)
             await cog.kick.callback(cog, ctx, member, "Violation of rules")
 
@@ -202,6 +197,35 @@ class TestUserCog:
         assert fields["Bots"] == "1"
         assert "66.67%" in fields["Verified Members"]
 
+    @pytest.mark.asyncio
+    async def test_whois_by_user_reuses_fetched_member(self, ctx, bot):
+        member = helpers.MockMember(id=2, name="Linked")
+        bot.get_member_or_user = AsyncMock(return_value=member)
+        link = MagicMock(htb_user_id=1337, discord_user_id=2)
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock(first=MagicMock(return_value=link)))
+
+        with patch("src.cmds.core.user.AsyncSessionLocal", return_value=helpers.mock_session_context(session)):
+            cog = user.UserCog(bot)
+            await cog.whois.callback(cog, ctx, member, None)
+
+        bot.get_member_or_user.assert_awaited_once_with(ctx.guild, member.id)
+        embed = ctx.respond.call_args[1]["embed"]
+        assert "1337" in {f.name: f.value for f in embed.fields}["HTB Profile:"]
+
+    @pytest.mark.asyncio
+    async def test_whois_by_htb_id_not_found(self, ctx, bot):
+        bot.get_member_or_user = AsyncMock()
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock(first=MagicMock(return_value=None)))
+
+        with patch("src.cmds.core.user.AsyncSessionLocal", return_value=helpers.mock_session_context(session)):
+            cog = user.UserCog(bot)
+            await cog.whois.callback(cog, ctx, None, 1337)
+
+        bot.get_member_or_user.assert_not_awaited()
+        ctx.respond.assert_awaited_once_with("Could not find with HTB ID 1337 in the records.")
+
     # ── _match_role tests ──────────────────────────────────────────────
 
     def test_match_role_no_role_manager(self, bot):
@@ -278,7 +302,7 @@ class TestUserCog:
     async def test_join_success(self, ctx, bot):
         """Test /join successfully adds the role."""
         guild_role = helpers.MockRole(id=111, name="Alpha")
-        ctx.guild.get_role = lambda rid: guild_role if rid == 111 else None
+        ctx.guild.get_role = {111: guild_role}.get
         ctx.user = helpers.MockMember()
         ctx.user.add_roles = AsyncMock()
         bot.role_manager.get_joinable_roles = lambda: {"Alpha": (111, "Alpha desc")}
@@ -306,7 +330,7 @@ class TestUserCog:
     async def test_leave_success(self, ctx, bot):
         """Test /leave successfully removes the role."""
         guild_role = helpers.MockRole(id=111, name="Alpha")
-        ctx.guild.get_role = lambda rid: guild_role if rid == 111 else None
+        ctx.guild.get_role = {111: guild_role}.get
         ctx.user = helpers.MockMember()
         ctx.user.remove_roles = AsyncMock()
         bot.role_manager.get_joinable_roles = lambda: {"Alpha": (111, "Alpha desc")}
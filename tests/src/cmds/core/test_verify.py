@@ -15,7 +15,7 @@ class TestVerifyCog:
         """Test successful certification verification adds the role."""
         bot.role_manager.get_cert_role_id = lambda abbrev: 5555
         guild_role = helpers.MockRole(id=5555, name="CPTS")
-        ctx.guild.get_role = lambda rid: guild_role if rid == 5555 else None
+        ctx.guild.get_role = {5555: guild_role}.get
         ctx.author = helpers.MockMember()
         ctx.author.add_roles = AsyncMock()
 
@@ -0,0 +1,30 @@
+from unittest import mock
+
+from src.database.utils import migrations
+
+
+class TestMigrationHelpers:
+
+    def test_set_lock_wait_timeout(self):
+        with mock.patch.object(migrations, "op") as op:
+            migrations.set_lock_wait_timeout(10)
+
+        op.execute.assert_called_once_with("SET SESSION lock_wait_timeout=10")
+
+    def test_create_index_online(self):
+        with mock.patch.object(migrations, "op") as op:
+            migrations.create_index_online("ix_ban_user_id", "ban", ["user_id", "unbanned"])
+
+        op.execute.assert_called_once_with(
+            "CREATE INDEX ix_ban_user_id ON ban (user_id, unbanned) ALGORITHM=INPLACE LOCK=NONE"
+        )
+
+    def test_batched_update_stops_on_partial_batch(self):
+        results = [mock.Mock(rowcount=2), mock.Mock(rowcount=2), mock.Mock(rowcount=1)]
+        with mock.patch.object(migrations, "op") as op:
+            op.get_bind.return_value.execute.side_effect = results
+            total = migrations.batched_update("UPDATE ban SET unbanned = 0 WHERE unbanned IS NULL", batch_size=2)
+
+        assert total == 5
+        assert op.get_bind.return_value.execute.call_count == 3
+        op.get_context.return_value.autocommit_block.assert_called_once()
@@ -1,26 +1,31 @@
+import logging
 from datetime import datetime, timezone
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from discord import Forbidden, HTTPException
-
-from src.helpers.ban import _check_member, _dm_banned_member, ban_member
+from sqlalchemy.exc import NoResultFound
+
+from src.helpers.ban import (
+    _check_member,
+    _dm_banned_member,
+    _get_ban_or_create,
+    ban_member,
+    unban_member,
+    unmute_member,
+)
 from src.helpers.responses import SimpleResponse
 from tests import helpers
 
 
-class TestBanHelpers:
-    @pytest.mark.asyncio
-    async def test__check_member_staff_member(self, bot, guild, member):
-        author = helpers.MockMember(name="Author User")
-        member_is_staff = mock.Mock(return_value=True)
-        with mock.patch("src.helpers.ban.member_is_staff", member_is_staff):
-            response = await _check_member(bot, guild, member, author)
-            assert isinstance(response, SimpleResponse)
-            assert response.message == "You cannot ban another staff member."
-            assert response.delete_after is None
+class MockResponse:
+    def __init__(self, status, reason):
+        self.status = status
+        self.reason = reason
+
 
+class TestBanHelpers:
     @pytest.mark.asyncio
     async def test__check_member_regular_member(self, bot, guild, member):
         author = helpers.MockMember(name="Author User")
@@ -35,24 +40,25 @@ class TestBanHelpers:
         bot.get_member_or_user = AsyncMock()
         bot.get_member_or_user.return_value = user
         response = await _check_member(bot, guild, user, author)
-        bot.get_member_or_user.assert_called_once_with(guild, user.id)
+        bot.get_member_or_user.assert_awaited_once_with(guild, user.id)
         assert response is None
 
     @pytest.mark.asyncio
-    async def test__check_member_ban_bot(self, bot, guild, member):
-        author = helpers.MockMember(name="Author User")
-        member.bot = True
-        response = await _check_member(bot, guild, member, author)
-        assert isinstance(response, SimpleResponse)
-        assert response.message == "You cannot ban a bot."
-        assert response.delete_after is None
-
-    @pytest.mark.asyncio
-    async def test__check_member_ban_self(self, bot, guild, member):
-        author = member
-        response = await _check_member(bot, guild, member, author)
+    @pytest.mark.parametrize(
+        "is_staff, is_bot, is_self, expected",
+        [
+            (True, False, False, "You cannot ban another staff member."),
+            (False, True, False, "You cannot ban a bot."),
+            (False, False, True, "You cannot ban yourself."),
+        ],
+    )
+    async def test__check_member_refuses(self, bot, guild, member, is_staff, is_bot, is_self, expected):
+        author = member if is_self else helpers.MockMember(name="Author User")
+        member.bot = is_bot
+        with mock.patch("src.helpers.ban.member_is_staff", mock.Mock(return_value=is_staff)):
+            response = await _check_member(bot, guild, member, author)
         assert isinstance(response, SimpleResponse)
-        assert response.message == "You cannot ban yourself."
+        assert response.message == expected
         assert response.delete_after is None
 
     @pytest.mark.asyncio
@@ -69,12 +75,7 @@ class TestBanHelpers:
         assert result is True
 
     @pytest.mark.asyncio
-    async def test__dm_banned_member_forbidden_exception(self, guild, member):
-        class MockResponse:
-            def __init__(self, status, reason):
-                self.status = status
-                self.reason = reason
-
+    async def test__dm_banned_member_forbidden_exception(self, guild, member, caplog):
         response = MockResponse(403, "Forbidden")
         message = {
             "code": 403,
@@ -83,17 +84,13 @@ class TestBanHelpers:
 
         forbidden = Forbidden(response, message)
         member.send = AsyncMock(side_effect=forbidden)
-        with pytest.warns(None):
+        with caplog.at_level(logging.WARNING, logger="src.helpers.ban"):
             result = await _dm_banned_member("2023-05-19", guild, member, "Violation of community guidelines")
         assert result is False
+        assert "due to privacy settings" in caplog.text
 
     @pytest.mark.asyncio
-    async def test__dm_banned_member_http_exception(self, guild, member):
-        class MockResponse:
-            def __init__(self, status, reason):
-                self.status = status
-                self.reason = reason
-
+    async def test__dm_banned_member_http_exception(self, guild, member, caplog):
         response = MockResponse(500, "Internal Server Error")
         message = {
             "code": 500,
@@ -102,9 +99,83 @@ class TestBanHelpers:
 
         http_exception = HTTPException(response, message)
         member.send = AsyncMock(side_effect=http_exception)
-        with pytest.warns(None):
+        with caplog.at_level(logging.WARNING, logger="src.helpers.ban"):
             result = await _dm_banned_member("2023-05-19", guild, member, "Violation of community guidelines")
         assert result is False
+        assert "HTTPException when trying to unban user" in caplog.text
+
+
+class TestGetBanOrCreate:
+    @staticmethod
+    def _session(existing_ban_id):
+        session = AsyncMock()
+        session.add = MagicMock()
+        session.scalar = AsyncMock(return_value=existing_ban_id)
+        return session, helpers.mock_session_context(session)
+
+    @pytest.mark.asyncio
+    async def test_returns_existing_ban(self, member):
+        session, session_ctx = self._session(7)
+        with patch("src.helpers.ban.AsyncSessionLocal", return_value=session_ctx) as session_local:
+            result = await _get_ban_or_create(member, MagicMock(), MagicMock())
+
+        assert result == (7, True)
+        session_local.assert_called_once()
+        session.add.assert_not_called()
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_creates_ban_in_same_session(self, member):
+        ban, infraction = MagicMock(id=8), MagicMock()
+        session, session_ctx = self._session(None)
+        with patch("src.helpers.ban.AsyncSessionLocal", return_value=session_ctx) as session_local:
+            result = await _get_ban_or_create(member, ban, infraction)
+
+        assert result == (8, False)
+        session_local.assert_called_once()
+        session.add.assert_any_call(ban)
+        session.add.assert_any_call(infraction)
+        session.commit.assert_awaited_once()
+
+
+class TestUnbanAndUnmute:
+    @staticmethod
+    def _session(rowcount):
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=rowcount))
+        return session, helpers.mock_session_context(session)
+
+    @pytest.mark.asyncio
+    async def test_unban_member_flags_ban_in_one_statement(self, guild, member):
+        session, session_ctx = self._session(1)
+        with patch("src.helpers.ban.AsyncSessionLocal", return_value=session_ctx):
+            assert await unban_member(guild, member) is member
+
+        guild.unban.assert_awaited_once_with(member)
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unban_member_without_open_ban(self, guild, member):
+        session, session_ctx = self._session(0)
+        with (
+            patch("src.helpers.ban.AsyncSessionLocal", return_value=session_ctx),
+            pytest.raises(NoResultFound),
+        ):
+            await unban_member(guild, member)
+
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unmute_member_without_mute(self, guild, user):
+        session, session_ctx = self._session(0)
+        with (
+            patch("src.helpers.ban.AsyncSessionLocal", return_value=session_ctx),
+            pytest.raises(NoResultFound),
+        ):
+            await unmute_member(guild, user)
+
+        session.commit.assert_not_awaited()
 
 
 class TestBanMember:
@@ -0,0 +1,13 @@
+from src.core import settings
+from src.helpers.checks import member_is_staff
+from tests import helpers
+
+
+def test_member_is_staff_with_staff_role():
+    member = helpers.MockMember(roles=[helpers.MockRole(id=settings.role_groups["ALL_MODS"][0])])
+    assert member_is_staff(member)
+
+
+def test_member_is_staff_without_staff_role():
+    member = helpers.MockMember(roles=[helpers.MockRole(id=1)])
+    assert not member_is_staff(member)
@@ -1,26 +1,24 @@
 import calendar
 import time
 
-from src.helpers.duration import validate_duration
-
-
-def test_validate_duration_numeric():
-    duration = "3600"
-    result = validate_duration(duration)
-    assert result == (0, "Malformed duration. Please use duration units, (e.g. 12h, 14d, 5w).")
-
+import pytest
 
-def test_validate_duration_invalid_parse():
-    duration = "not-to-be-parsed"
-    result = validate_duration(duration)
-    assert result == (0, "Invalid duration: could not parse.")
+from src.helpers.duration import validate_duration
 
 
-def test_validate_duration_past():
-    duration = "-1h"
+@pytest.mark.parametrize(
+    "duration, message",
+    [
+        ("3600", "Malformed duration. Please use duration units, (e.g. 12h, 14d, 5w)."),
+        ("not-to-be-parsed", "Invalid duration: could not parse."),
+        ("-1h", "Invalid duration: cannot be in the past."),
+        ("0s", "Invalid duration: cannot be in the past."),
+    ]
+)
+def test_validate_duration_rejected(duration, message):
     baseline_ts = calendar.timegm(time.gmtime())
     result = validate_duration(duration, baseline_ts=baseline_ts)
-    assert result == (0, "Invalid duration: cannot be in the past.")
+    assert result == (0, message)
 
 
 def test_validate_duration_valid():
@@ -35,10 +33,3 @@ def test_validate_duration_valid_with_baseline():
     baseline_ts = calendar.timegm(time.gmtime()) + 3600  # Set baseline in the future
     result = validate_duration(duration, baseline_ts=baseline_ts)
     assert result == (baseline_ts + 3600, "")
-
-
-def test_validate_duration_zero():
-    duration = "0s"
-    baseline_ts = calendar.timegm(time.gmtime())
-    result = validate_duration(duration, baseline_ts)
-    assert result == (0, "Invalid duration: cannot be in the past.")
@@ -118,12 +118,12 @@ class TestProcessLabsIdentification(unittest.IsolatedAsyncioTestCase):
         self.rank_role = MagicMock(spec=discord.Role)
 
         # Set up guild.get_role to return appropriate roles by test IDs
-        self.guild.get_role.side_effect = lambda role_id: {
+        self.guild.get_role.side_effect = {
             _SHERLOCK_ROLE_ID: self.sherlock_role,
             _CHALLENGE_ROLE_ID: self.challenge_role,
             _BOX_ROLE_ID: self.box_role,
             _HACKER_ROLE_ID: self.rank_role,
-        }.get(role_id)
+        }.get
 
         # Set up role manager on bot
         self.bot.role_manager = _make_test_role_manager()
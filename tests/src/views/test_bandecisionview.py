@@ -3,8 +3,10 @@ from unittest import mock
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from discord import NotFound
 from discord.ui import Button
 
+from src.bot import Bot
 from src.views.bandecisionview import BanDecisionView, DisputeModal, register_ban_views
 from tests import helpers
 
@@ -52,12 +54,14 @@ def _make_ban(
     return ban
 
 
-def _session_ctx(session_mock: AsyncMock) -> MagicMock:
-    """Wrap an AsyncMock session so it works as ``async with AsyncSessionLocal() as s``."""
-    ctx = MagicMock()
-    ctx.__aenter__ = AsyncMock(return_value=session_mock)
-    ctx.__aexit__ = AsyncMock(return_value=False)
-    return ctx
+@pytest.fixture
+def db_session(monkeypatch) -> AsyncMock:
+    """Mocked session handed out by `AsyncSessionLocal()` in the view module."""
+    session = AsyncMock()
+    monkeypatch.setattr(
+        "src.views.bandecisionview.AsyncSessionLocal", lambda: helpers.mock_session_context(session)
+    )
+    return session
 
 
 class TestBanDecisionViewInit:
@@ -130,11 +134,9 @@ class TestResolveMemberName:
 
 class TestApproveCallback:
     @pytest.mark.asyncio
-    async def test_approve_happy_path(self, bot, guild):
+    async def test_approve_happy_path(self, bot, guild, db_session):
         ban = _make_ban(ban_id=1, user_id=42)
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=ban)
-        session.commit = AsyncMock()
+        db_session.get = AsyncMock(return_value=ban)
 
         channel = helpers.MockTextChannel()
         guild.get_channel = MagicMock(return_value=channel)
@@ -149,15 +151,11 @@ class TestApproveCallback:
 
         view = BanDecisionView(ban_id=1, bot=bot)
 
-        with patch(
-            "src.views.bandecisionview.AsyncSessionLocal",
-            return_value=_session_ctx(session),
-        ):
-            await view._approve(interaction)
+        await view._approve(interaction)
 
         interaction.response.defer.assert_awaited_once_with(ephemeral=True)
         assert ban.approved is True
-        session.commit.assert_awaited_once()
+        db_session.commit.assert_awaited_once()
 
         interaction.followup.send.assert_awaited_once()
         assert "approved" in interaction.followup.send.call_args[0][0].lower()
@@ -167,18 +165,13 @@ class TestApproveCallback:
         assert "Approved Duration" in interaction.message.edit.call_args[1]["content"]
 
     @pytest.mark.asyncio
-    async def test_approve_ban_not_found(self, bot, guild):
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=None)
+    async def test_approve_ban_not_found(self, bot, guild, db_session):
+        db_session.get = AsyncMock(return_value=None)
 
         interaction = _make_interaction(guild=guild)
         view = BanDecisionView(ban_id=999, bot=bot)
 
-        with patch(
-            "src.views.bandecisionview.AsyncSessionLocal",
-            return_value=_session_ctx(session),
-        ):
-            await view._approve(interaction)
+        await view._approve(interaction)
 
         interaction.response.defer.assert_awaited_once_with(ephemeral=True)
         interaction.followup.send.assert_awaited_once()
@@ -186,11 +179,9 @@ class TestApproveCallback:
         interaction.message.edit.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_approve_disables_approve_button(self, bot, guild):
+    async def test_approve_disables_approve_button(self, bot, guild, db_session):
         ban = _make_ban(ban_id=3, user_id=42)
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=ban)
-        session.commit = AsyncMock()
+        db_session.get = AsyncMock(return_value=ban)
 
         channel = helpers.MockTextChannel()
         guild.get_channel = MagicMock(return_value=channel)
@@ -199,11 +190,7 @@ class TestApproveCallback:
         interaction = _make_interaction(guild=guild)
         view = BanDecisionView(ban_id=3, bot=bot)
 
-        with patch(
-            "src.views.bandecisionview.AsyncSessionLocal",
-            return_value=_session_ctx(session),
-        ):
-            await view._approve(interaction)
+        await view._approve(interaction)
 
         for child in view.children:
             if isinstance(child, Button):
@@ -213,11 +200,9 @@ class TestApproveCallback:
                     assert not child.disabled
 
     @pytest.mark.asyncio
-    async def test_approve_skips_channel_send_when_channel_is_none(self, bot, guild):
+    async def test_approve_skips_channel_send_when_channel_is_none(self, bot, guild, db_session):
         ban = _make_ban(ban_id=1, user_id=42)
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=ban)
-        session.commit = AsyncMock()
+        db_session.get = AsyncMock(return_value=ban)
 
         guild.get_channel = MagicMock(return_value=None)
         bot.get_member_or_user = AsyncMock(return_value=helpers.MockMember(name="User"))
@@ -225,22 +210,36 @@ class TestApproveCallback:
         interaction = _make_interaction(guild=guild)
         view = BanDecisionView(ban_id=1, bot=bot)
 
-        with patch(
-            "src.views.bandecisionview.AsyncSessionLocal",
-            return_value=_session_ctx(session),
-        ):
-            await view._approve(interaction)
+        await view._approve(interaction)
 
         interaction.followup.send.assert_awaited_once()
         interaction.message.edit.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_approve_logs_failed_message_edit(self, bot, guild, db_session, caplog):
+        ban = _make_ban(ban_id=1, user_id=42)
+        db_session.get = AsyncMock(return_value=ban)
+
+        channel = helpers.MockTextChannel()
+        guild.get_channel = MagicMock(return_value=channel)
+        bot.get_member_or_user = AsyncMock(return_value=helpers.MockMember(name="User"))
+
+        interaction = _make_interaction(guild=guild)
+        interaction.message.edit = AsyncMock(side_effect=NotFound(MagicMock(), "Unknown Message"))
+        view = BanDecisionView(ban_id=1, bot=bot)
+
+        await view._approve(interaction)
+
+        db_session.commit.assert_awaited_once()
+        interaction.followup.send.assert_awaited_once()
+        channel.send.assert_awaited_once()
+        assert "Could not publish ban decision" in caplog.text
+
 
 class TestDenyCallback:
     @pytest.mark.asyncio
-    async def test_deny_happy_path(self, bot, guild):
-        ban = _make_ban(ban_id=2, user_id=42)
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=ban)
+    async def test_deny_happy_path(self, bot, guild, db_session):
+        db_session.scalar = AsyncMock(return_value=42)
 
         channel = helpers.MockTextChannel()
         guild.get_channel = MagicMock(return_value=channel)
@@ -255,10 +254,6 @@ class TestDenyCallback:
         view = BanDecisionView(ban_id=2, bot=bot)
 
         with (
-            patch(
-                "src.views.bandecisionview.AsyncSessionLocal",
-                return_value=_session_ctx(session),
-            ),
             patch("src.helpers.ban.unban_member", new_callable=AsyncMock) as mock_unban,
         ):
             await view._deny(interaction)
@@ -274,28 +269,21 @@ class TestDenyCallback:
         assert "Denied and Unbanned" in interaction.message.edit.call_args[1]["content"]
 
     @pytest.mark.asyncio
-    async def test_deny_ban_not_found(self, bot, guild):
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=None)
+    async def test_deny_ban_not_found(self, bot, guild, db_session):
+        db_session.scalar = AsyncMock(return_value=None)
 
         interaction = _make_interaction(guild=guild)
         view = BanDecisionView(ban_id=999, bot=bot)
 
-        with patch(
-            "src.views.bandecisionview.AsyncSessionLocal",
-            return_value=_session_ctx(session),
-        ):
-            await view._deny(interaction)
+        await view._deny(interaction)
 
         interaction.followup.send.assert_awaited_once()
         assert "not found" in interaction.followup.send.call_args[0][0].lower()
         interaction.message.edit.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_deny_disables_all_buttons(self, bot, guild):
-        ban = _make_ban(ban_id=4, user_id=42)
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=ban)
+    async def test_deny_disables_all_buttons(self, bot, guild, db_session):
+        db_session.scalar = AsyncMock(return_value=42)
 
         guild.get_channel = MagicMock(return_value=helpers.MockTextChannel())
         bot.get_member_or_user = AsyncMock(return_value=helpers.MockMember(name="User"))
@@ -304,10 +292,6 @@ class TestDenyCallback:
         view = BanDecisionView(ban_id=4, bot=bot)
 
         with (
-            patch(
-                "src.views.bandecisionview.AsyncSessionLocal",
-                return_value=_session_ctx(session),
-            ),
             patch("src.helpers.ban.unban_member", new_callable=AsyncMock),
         ):
             await view._deny(interaction)
@@ -317,10 +301,8 @@ class TestDenyCallback:
                 assert child.disabled
 
     @pytest.mark.asyncio
-    async def test_deny_member_not_found_skips_unban(self, bot, guild):
-        ban = _make_ban(ban_id=5, user_id=42)
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=ban)
+    async def test_deny_member_not_found_skips_unban(self, bot, guild, db_session):
+        db_session.scalar = AsyncMock(return_value=42)
 
         guild.get_channel = MagicMock(return_value=helpers.MockTextChannel())
         bot.get_member_or_user = AsyncMock(return_value=None)
@@ -329,10 +311,6 @@ class TestDenyCallback:
         view = BanDecisionView(ban_id=5, bot=bot)
 
         with (
-            patch(
-                "src.views.bandecisionview.AsyncSessionLocal",
-                return_value=_session_ctx(session),
-            ),
             patch("src.helpers.ban.unban_member", new_callable=AsyncMock) as mock_unban,
         ):
             await view._deny(interaction)
@@ -376,12 +354,11 @@ class TestDisputeModalCallback:
         )
 
     @pytest.mark.asyncio
-    async def test_dispute_modal_ban_not_found(self, bot, guild):
+    async def test_dispute_modal_ban_not_found(self, bot, guild, db_session):
         view = BanDecisionView(ban_id=999, bot=bot)
         modal = DisputeModal(ban_id=999, bot=bot, parent_view=view)
 
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=None)
+        db_session.get = AsyncMock(return_value=None)
 
         interaction = _make_interaction(guild=guild)
         modal.children[0].value = "1d"
@@ -392,10 +369,6 @@ class TestDisputeModalCallback:
                 "src.views.bandecisionview.validate_duration",
                 return_value=(future_ts, ""),
             ),
-            patch(
-                "src.views.bandecisionview.AsyncSessionLocal",
-                return_value=_session_ctx(session),
-            ),
         ):
             await modal.callback(interaction)
 
@@ -403,11 +376,9 @@ class TestDisputeModalCallback:
         assert "not found" in interaction.response.send_message.call_args[0][0].lower()
 
     @pytest.mark.asyncio
-    async def test_dispute_modal_happy_path(self, bot, guild):
+    async def test_dispute_modal_happy_path(self, bot, guild, db_session):
         ban = _make_ban(ban_id=6, user_id=42)
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=ban)
-        session.commit = AsyncMock()
+        db_session.get = AsyncMock(return_value=ban)
 
         channel = helpers.MockTextChannel()
         guild.get_channel = MagicMock(return_value=channel)
@@ -428,28 +399,22 @@ class TestDisputeModalCallback:
                 "src.views.bandecisionview.validate_duration",
                 return_value=(future_ts, ""),
             ),
-            patch(
-                "src.views.bandecisionview.AsyncSessionLocal",
-                return_value=_session_ctx(session),
-            ),
             patch("src.views.bandecisionview.schedule", new_callable=AsyncMock),
         ):
             await modal.callback(interaction)
 
         assert ban.unban_time == future_ts
         assert ban.approved is True
-        session.commit.assert_awaited_once()
+        db_session.commit.assert_awaited_once()
 
         interaction.response.send_message.assert_awaited_once()
         assert "updated" in interaction.response.send_message.call_args[0][0].lower()
         channel.send.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_dispute_modal_disables_all_buttons(self, bot, guild):
+    async def test_dispute_modal_disables_all_buttons(self, bot, guild, db_session):
         ban = _make_ban(ban_id=7, user_id=42)
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=ban)
-        session.commit = AsyncMock()
+        db_session.get = AsyncMock(return_value=ban)
 
         guild.get_channel = MagicMock(return_value=helpers.MockTextChannel())
         bot.get_member_or_user = AsyncMock(return_value=helpers.MockMember(name="User"))
@@ -466,10 +431,6 @@ class TestDisputeModalCallback:
                 "src.views.bandecisionview.validate_duration",
                 return_value=(future_ts, ""),
             ),
-            patch(
-                "src.views.bandecisionview.AsyncSessionLocal",
-                return_value=_session_ctx(session),
-            ),
             patch("src.views.bandecisionview.schedule", new_callable=AsyncMock),
         ):
             await modal.callback(interaction)
@@ -480,12 +441,10 @@ class TestDisputeModalCallback:
 
     @pytest.mark.asyncio
     async def test_dispute_modal_skips_message_edit_when_message_is_none(
-        self, bot, guild
+        self, bot, guild, db_session
     ):
         ban = _make_ban(ban_id=8, user_id=42)
-        session = AsyncMock()
-        session.get = AsyncMock(return_value=ban)
-        session.commit = AsyncMock()
+        db_session.get = AsyncMock(return_value=ban)
 
         guild.get_channel = MagicMock(return_value=helpers.MockTextChannel())
         bot.get_member_or_user = AsyncMock(return_value=helpers.MockMember(name="User"))
@@ -503,10 +462,6 @@ class TestDisputeModalCallback:
                 "src.views.bandecisionview.validate_duration",
                 return_value=(future_ts, ""),
             ),
-            patch(
-                "src.views.bandecisionview.AsyncSessionLocal",
-                return_value=_session_ctx(session),
-            ),
             patch("src.views.bandecisionview.schedule", new_callable=AsyncMock),
         ):
             await modal.callback(interaction)
@@ -516,42 +471,32 @@ class TestDisputeModalCallback:
 
 class TestRegisterBanViews:
     @pytest.mark.asyncio
-    async def test_registers_views_for_unapproved_bans(self, bot):
-        ban_a = _make_ban(ban_id=10)
-        ban_b = _make_ban(ban_id=20)
-
-        scalars_result = MagicMock()
-        scalars_result.all.return_value = [ban_a, ban_b]
-
-        session = AsyncMock()
-        session.scalars = AsyncMock(return_value=scalars_result)
+    async def test_registers_views_for_unapproved_bans(self, bot, db_session):
+        db_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult([10, 20]))
 
         bot.add_view = MagicMock()
 
-        with patch(
-            "src.views.bandecisionview.AsyncSessionLocal",
-            return_value=_session_ctx(session),
-        ):
-            await register_ban_views(bot)
+        await register_ban_views(bot)
 
         assert bot.add_view.call_count == 2
         registered_ids = {call.args[0].ban_id for call in bot.add_view.call_args_list}
         assert registered_ids == {10, 20}
 
     @pytest.mark.asyncio
-    async def test_no_views_registered_when_no_pending_bans(self, bot):
-        scalars_result = MagicMock()
-        scalars_result.all.return_value = []
-
-        session = AsyncMock()
-        session.scalars = AsyncMock(return_value=scalars_result)
+    async def test_no_views_registered_when_no_pending_bans(self, bot, db_session):
+        db_session.scalars = AsyncMock(return_value=helpers.MockScalarsResult([]))
 
         bot.add_view = MagicMock()
 
-        with patch(
-            "src.views.bandecisionview.AsyncSessionLocal",
-            return_value=_session_ctx(session),
-        ):
-            await register_ban_views(bot)
+        await register_ban_views(bot)
 
         bot.add_view.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bot_registers_views_once_across_reconnects(self):
+        client = Bot(mock=True)
+        with patch("src.views.bandecisionview.register_ban_views", new_callable=AsyncMock) as register_mock:
+            await client._register_persistent_views()
+            await client._register_persistent_views()
+
+        register_mock.assert_awaited_once_with(client)
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from src.core import settings
 from src.webhooks.handlers.academy import AcademyHandler
 from src.webhooks.types import WebhookBody, Platform, WebhookEvent
 from tests import helpers
@@ -14,6 +15,19 @@ def _make_role_manager(**overrides):
     return rm
 
 
+def _verify_logs_patch():
+    """Point the verify logs channel at a fixed ID, leaving the rest of the settings untouched."""
+    return patch.object(settings.channels, "VERIFY_LOGS", 777)
+
+
+def _make_guild(verify_channel):
+    """Build the guild the handler resolves the certificate role and *verify_channel* from."""
+    guild = helpers.MockGuild(id=1)
+    guild.get_role.return_value = MagicMock()
+    guild.get_channel.return_value = verify_channel
+    return guild
+
+
 class TestAcademyHandler:
     @pytest.mark.asyncio
     async def test_handle_certificate_awarded_success(self, bot):
@@ -40,13 +54,9 @@ class TestAcademyHandler:
 
         bot.role_manager = _make_role_manager(get_academy_cert_role=lambda cid: 555)
 
-        with patch("src.webhooks.handlers.academy.settings") as mock_settings:
-            mock_settings.channels.VERIFY_LOGS = 777
-            mock_guild = helpers.MockGuild(id=1)
-            mock_guild.get_role.return_value = MagicMock()
+        with _verify_logs_patch():
             mock_channel = AsyncMock()
-            mock_guild.get_channel.return_value = mock_channel
-            bot.guilds = [mock_guild]
+            bot.guilds = [_make_guild(mock_channel)]
 
             result = await handler._handle_certificate_awarded(body, bot)
             mock_member.add_roles.assert_awaited()
@@ -79,13 +89,9 @@ class TestAcademyHandler:
 
         bot.role_manager = _make_role_manager(get_academy_cert_role=lambda cid: 555)
 
-        with patch("src.webhooks.handlers.academy.settings") as mock_settings:
-            mock_settings.channels.VERIFY_LOGS = 777
-            mock_guild = helpers.MockGuild(id=1)
-            mock_guild.get_role.return_value = MagicMock()
+        with _verify_logs_patch():
             mock_channel = AsyncMock()
-            mock_guild.get_channel.return_value = mock_channel
-            bot.guilds = [mock_guild]
+            bot.guilds = [_make_guild(mock_channel)]
 
             result = await handler._handle_certificate_awarded(body, bot)
             mock_member.add_roles.assert_awaited()
@@ -146,13 +152,9 @@ class TestAcademyHandler:
 
         bot.role_manager = _make_role_manager(get_academy_cert_role=lambda cid: 555)
 
-        with patch("src.webhooks.handlers.academy.settings") as mock_settings:
-            mock_settings.channels.VERIFY_LOGS = 777
-            mock_guild = helpers.MockGuild(id=1)
-            mock_guild.get_role.return_value = MagicMock()
+        with _verify_logs_patch():
             mock_channel = AsyncMock()
-            mock_guild.get_channel.return_value = mock_channel
-            bot.guilds = [mock_guild]
+            bot.guilds = [_make_guild(mock_channel)]
 
             with pytest.raises(Exception, match="add_roles error"):
                 await handler._handle_certificate_awarded(body, bot)
@@ -183,14 +185,10 @@ class TestAcademyHandler:
         bot.role_manager = _make_role_manager(get_academy_cert_role=lambda cid: 555)
 
         with (
-            patch("src.webhooks.handlers.academy.settings") as mock_settings,
+            _verify_logs_patch(),
             patch.object(handler.logger, "warning") as mock_log,
         ):
-            mock_settings.channels.VERIFY_LOGS = 777
-            mock_guild = helpers.MockGuild(id=1)
-            mock_guild.get_role.return_value = MagicMock()
-            mock_guild.get_channel.return_value = None
-            bot.guilds = [mock_guild]
+            bot.guilds = [_make_guild(None)]
 
             result = await handler._handle_certificate_awarded(body, bot)
 
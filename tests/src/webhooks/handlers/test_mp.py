@@ -119,7 +119,7 @@ class TestMPHandler:
             get_role_id=lambda cat, key: 1 if key == "1" else (10 if key == "10" else None),
         )
         mock_guild = helpers.MockGuild(id=1)
-        mock_guild.get_role.side_effect = lambda rid: mock_role_1 if rid == 1 else mock_role_10
+        mock_guild.get_role.side_effect = {1: mock_role_1, 10: mock_role_10}.get
         bot.guilds = [mock_guild]
 
         result = await handler._handle_hof_change(body, bot)
@@ -152,7 +152,7 @@ class TestMPHandler:
             get_role_id=lambda cat, key: None,
         )
         mock_guild = helpers.MockGuild(id=1)
-        mock_guild.get_role.side_effect = lambda rid: None
+        mock_guild.get_role.return_value = None
         bot.guilds = [mock_guild]
 
         with pytest.raises(ValueError, match="Invalid HOF tier"):
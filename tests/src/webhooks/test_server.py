@@ -0,0 +1,25 @@
+import hashlib
+import hmac
+
+from src.webhooks.server import verify_signature
+
+
+class TestVerifySignature:
+    """Test the webhook HMAC signature verification."""
+
+    def test_valid_signature(self):
+        body = b'{"platform": "mp"}'
+        signature = hmac.new(b"secret", body, hashlib.sha1).hexdigest()
+
+        assert verify_signature(body, signature, "secret")
+        # The keyed template is reused, so a second request must not see the first body.
+        assert verify_signature(body, signature, "secret")
+
+    def test_invalid_signature(self):
+        body = b'{"platform": "mp"}'
+        signature = hmac.new(b"other", body, hashlib.sha1).hexdigest()
+
+        assert not verify_signature(body, signature, "secret")
+
+    def test_missing_signature(self):
+        assert not verify_signature(b"{}", None, "secret")